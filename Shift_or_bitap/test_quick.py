@@ -8,10 +8,25 @@ Author: DNA Pattern Matching Project
 Date: November 2025
 """
 
+import functools
+
 from shift_or_exact import ShiftOrExact
 from shift_or_approximate import ShiftOrApproximate
 from shift_or_extended import ShiftOrExtended
 
+
+@functools.lru_cache(maxsize=None)
+def make_matcher(cls, pattern, k=None):
+    """
+    Return a matcher for (cls, pattern, k), building its bitmasks only once.
+
+    Matchers are read-only after construction, so tests that reuse the same
+    pattern share one instance instead of redoing the O(σ·m) preprocessing.
+    """
+    if k is None:
+        return cls(pattern)
+    return cls(pattern, k=k)
+
 def test_exact_matching():
     """Test exact matching algorithm."""
     print("=" * 60)
@@ -21,7 +36,7 @@ def test_exact_matching():
     # Test 1: Basic exact match
     text = "ACGTACGTACGT"
     pattern = "ACGT"
-    matcher = ShiftOrExact(pattern)
+    matcher = make_matcher(ShiftOrExact, pattern)
     matches = matcher.search(text)
     expected = [0, 4, 8]
     assert matches == expected, f"Expected {expected}, got {matches}"
@@ -30,7 +45,7 @@ def test_exact_matching():
     # Test 2: No matches
     text = "AAAAAAAA"
     pattern = "CGCG"
-    matcher = ShiftOrExact(pattern)
+    matcher = make_matcher(ShiftOrExact, pattern)
     matches = matcher.search(text)
     assert matches == [], f"Expected no matches, got {matches}"
     print(f"✓ No match: Pattern '{pattern}' correctly not found")
@@ -38,14 +53,14 @@ def test_exact_matching():
     # Test 3: Longer pattern
     text = "ACGTACGTTAGCTAGCTAGCT"
     pattern = "TAGCT"
-    matcher = ShiftOrExact(pattern)
+    matcher = make_matcher(ShiftOrExact, pattern)
     matches = matcher.search(text)
     print(f"✓ Longer pattern: Found at positions {matches}")
 
     # Test 4: Maximum length (64 bp)
     pattern_64 = "A" * 64
     text_64 = "C" * 100 + "A" * 64 + "T" * 100
-    matcher = ShiftOrExact(pattern_64)
+    matcher = make_matcher(ShiftOrExact, pattern_64)
     matches = matcher.search(text_64)
     assert 100 in matches, "64 bp pattern not found"
     print(f"✓ 64 bp pattern: Successfully handled maximum length")
@@ -53,7 +68,7 @@ def test_exact_matching():
     # Test 5: Metrics tracking
     pattern = "ACGT"
     text = "ACGTACGTACGT"
-    matcher = ShiftOrExact(pattern)
+    matcher = make_matcher(ShiftOrExact, pattern)
     metrics = matcher.search_with_metrics(text)
     print(f"✓ Metrics: {metrics['bit_operations']} bit operations, "
           f"{metrics['state_vectors']} state vector(s)")
@@ -70,7 +85,7 @@ def test_approximate_matching():
     # Test 1: k=1 - one substitution
     text = "ACGTACTT"  # Second match has one substitution (G→T)
     pattern = "ACGT"
-    matcher = ShiftOrApproximate(pattern, k=1)
+    matcher = make_matcher(ShiftOrApproximate, pattern, k=1)
     matches = matcher.search(text)
     positions = [pos for pos, error in matches]
     assert 0 in positions and 4 in positions, f"Expected matches at 0 and 4, got {positions}"
@@ -79,14 +94,14 @@ def test_approximate_matching():
     # Test 2: k=2 - multiple errors
     text = "ACGTACTTACAT"
     pattern = "ACGT"
-    matcher = ShiftOrApproximate(pattern, k=2)
+    matcher = make_matcher(ShiftOrApproximate, pattern, k=2)
     matches = matcher.search(text)
     print(f"✓ k=2 (multiple errors): Found {len(matches)} matches")
 
     # Test 3: k=3 - three errors
     pattern = "AAAA"
     text = "TTTT"  # All 4 characters differ
-    matcher = ShiftOrApproximate(pattern, k=3)
+    matcher = make_matcher(ShiftOrApproximate, pattern, k=3)
     matches = matcher.search(text)
     print(f"✓ k=3 (three errors): Found {len(matches)} matches")
 
@@ -94,7 +109,7 @@ def test_approximate_matching():
     text = "ACGTACTTACATAAAA"
     pattern = "ACGT"
     for k in [1, 2, 3]:
-        matcher = ShiftOrApproximate(pattern, k=k)
+        matcher = make_matcher(ShiftOrApproximate, pattern, k=k)
         matches = matcher.search(text)
         error_levels = [error for pos, error in matches]
         print(f"✓ k={k}: {len(matches)} matches, error levels: {set(error_levels)}")
@@ -102,7 +117,7 @@ def test_approximate_matching():
     # Test 5: Metrics with approximate matching
     pattern = "ACGT"
     text = "ACGTACTTACGT"
-    matcher = ShiftOrApproximate(pattern, k=1)
+    matcher = make_matcher(ShiftOrApproximate, pattern, k=1)
     metrics = matcher.search_with_metrics(text)
     print(f"✓ Approximate metrics: {metrics['state_vectors']} state vectors")
 
@@ -118,7 +133,7 @@ def test_extended_matching():
     # Test 1: 100 bp pattern
     pattern_100 = "A" * 100
     text_100 = "C" * 200 + "A" * 100 + "T" * 200
-    matcher = ShiftOrExtended(pattern_100)
+    matcher = make_matcher(ShiftOrExtended, pattern_100)
     matches = matcher.search(text_100)
     assert 200 in matches, "100 bp pattern not found"
     print(f"✓ 100 bp pattern: Found at position {matches}")
@@ -126,7 +141,7 @@ def test_extended_matching():
     # Test 2: 200 bp pattern
     pattern_200 = "ACGT" * 50  # 200 bp
     text_200 = "T" * 500 + pattern_200 + "G" * 500
-    matcher = ShiftOrExtended(pattern_200)
+    matcher = make_matcher(ShiftOrExtended, pattern_200)
     matches = matcher.search(text_200)
     assert 500 in matches, "200 bp pattern not found"
     print(f"✓ 200 bp pattern: Found at position {matches}")
@@ -134,7 +149,7 @@ def test_extended_matching():
     # Test 3: 400 bp pattern
     pattern_400 = "ACGT" * 100  # 400 bp
     text_400 = "NNNN" + pattern_400 + "NNNN"
-    matcher = ShiftOrExtended(pattern_400)
+    matcher = make_matcher(ShiftOrExtended, pattern_400)
     matches = matcher.search(text_400)
     assert 4 in matches, "400 bp pattern not found"
     print(f"✓ 400 bp pattern: Successfully handled")
@@ -142,7 +157,7 @@ def test_extended_matching():
     # Test 4: 800 bp pattern (maximum)
     pattern_800 = "ACGT" * 200  # 800 bp
     text_800 = pattern_800 + "NNNN"
-    matcher = ShiftOrExtended(pattern_800)
+    matcher = make_matcher(ShiftOrExtended, pattern_800)
     matches = matcher.search(text_800)
     assert 0 in matches, "800 bp pattern not found"
     print(f"✓ 800 bp pattern: Maximum length handled")
@@ -150,7 +165,7 @@ def test_extended_matching():
     # Test 5: Multi-word metrics
     pattern_150 = "A" * 150
     text_150 = "A" * 300
-    matcher = ShiftOrExtended(pattern_150)
+    matcher = make_matcher(ShiftOrExtended, pattern_150)
     metrics = matcher.search_with_metrics(text_150)
     print(f"✓ Multi-word metrics: {metrics['state_vectors']} state vectors, "
           f"{metrics['bit_operations']} bit operations")
@@ -13,11 +13,16 @@ The script follows the project roadmap:
 from __future__ import annotations
 
 import csv
+import gc
 import glob
+import multiprocessing
 import os
+import platform
 import re
 import time
-from typing import Callable, Dict, Iterable, List, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Tuple
 
 import psutil
 
@@ -31,9 +36,43 @@ from suffix_tree import (
     naive_search,
     build_ukkonen_suffix_tree,
     ukkonen_search,
+    build_sa_search_index,
+    sa_index_search,
 )
 
 
+PATTERNS_TO_SEARCH = [
+    "TCTGTGT",
+    "TAAAATTTTATTGACTTA",
+    "CACCACCATCACCATTACCAC",
+    "TTTTTTTTTT",
+    "AGCTTTTCATTCTGACTGCAACGGGCAATA",
+    "GTTACCTGCCGTGAGTAAATTAAAATTTTATTGACTTAGGTCACTAAATACTT",
+    "AACGGTGCGGGCTGACGCGTACAGGAAACACAGAAAAAAGCCCGCACCTGACAGTGCGGGCTTTTTTTTTCGACCAAAGGTAACGAGGTAACAACCATGCGA",
+    "GGCGGCAATATCGAAACTGTTGCCATCGACGGCGATTTCGATGCCTGTCAGGCGCTGGTGAAGCAGGCGTTTGATGATGAAGAACTGAAAGTGGCGCTAGGGTTAAACTCGGCTAACTCGATTAACATCAGCCGTTTGCTGGCGCAGA",
+    "GATTACAZZZ",
+]
+# Run sa_naive up to n=10000 (will run on 1k, 5k, 10k)
+SA_NAIVE_THRESHOLD: int = 100_000
+
+# Run st_naive only up to n=2000 (will run on 1k only)
+ST_NAIVE_THRESHOLD: int = 2_001
+N_SIZES_FOR_LARGE_FILES = [
+    1_000,
+    2_000,
+    3_000,
+    4_000,
+    5_000,
+    10_000,
+    25_000,
+    50_000,
+    75_000,
+    100_000,
+    150_000,
+    200_000,
+]
+
+
 def parse_fasta_file(filepath: str) -> str:
     """Return a contiguous uppercase string extracted from a FASTA file.
 
@@ -67,65 +106,254 @@ def current_memory_bytes() -> int:
     return process.memory_info().rss
 
 
+@contextmanager
+def timed_region() -> Iterator[None]:
+    """Suspend the cyclic garbage collector for the duration of a timing.
+
+    A full collection over a large suffix tree can take longer than the
+    operation being measured, so collections are deferred until the timed
+    block exits.
+    """
+
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+def pin_worker_to_core(next_slot: multiprocessing.sharedctypes.Synchronized) -> None:
+    """Pin the calling worker process to a dedicated CPU core (Linux only).
+
+    Used as the process-pool initializer: each worker claims the next slot
+    from a shared counter so workers land on distinct cores and are not
+    migrated between cores mid-measurement.
+    """
+
+    if platform.system() != "Linux":
+        return
+    cores = sorted(os.sched_getaffinity(0))
+    with next_slot.get_lock():
+        slot = next_slot.value
+        next_slot.value += 1
+    os.sched_setaffinity(0, {cores[slot % len(cores)]})
+
+
 def benchmark_construction(build_fn: Callable[[str], object], text: str) -> Tuple[object, float, int]:
     """Time and measure memory for a construction routine."""
 
     start_mem = current_memory_bytes()
-    start_time = time.perf_counter()
-    structure = build_fn(text)
-    end_time = time.perf_counter()
+    with timed_region():
+        start_time = time.perf_counter()
+        structure = build_fn(text)
+        end_time = time.perf_counter()
     end_mem = current_memory_bytes()
 
     return structure, end_time - start_time, end_mem - start_mem
 
 
-def benchmark_query(query_fn: Callable[..., object], *args: object) -> float:
-    """Return execution time for a query routine."""
+def benchmark_query(query_fn: Callable[..., object], *args: object, repeat: int = 10) -> float:
+    """Return execution time (seconds) for a query routine.
 
-    start_time = time.perf_counter()
-    query_fn(*args)
-    end_time = time.perf_counter()
-    return end_time - start_time
+    Timestamps are taken with ``perf_counter_ns`` so sub-microsecond queries
+    are not rounded away by float subtraction.  The query is executed
+    *repeat* times and the fastest run is reported, which filters out GC
+    pauses and interpreter warm-up from the measurement.
+    """
+
+    best_ns = None
+    with timed_region():
+        for _ in range(max(1, repeat)):
+            start_ns = time.perf_counter_ns()
+            query_fn(*args)
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            if best_ns is None or elapsed_ns < best_ns:
+                best_ns = elapsed_ns
+    return best_ns / 1e9
 
 
-def write_csv_row(writer: csv.writer, row: Iterable[object]) -> None:
-    """Write a single row to the CSV output."""
+def run_one(dataset_name: str, text: str) -> List[List[object]]:
+    """Benchmark every structure on one (dataset, n) pair and return CSV rows.
 
-    writer.writerow(row)
+    Each pair is independent of the others, so the function runs in a worker
+    process and hands its rows back to the parent for writing.
+    """
+
+    n = len(text)
+    print(f"  Benchmarking {dataset_name} (n={n})...")
+
+    built_structures: Dict[str, object] = {}
+    # Rows are buffered and handed back so the parent can flush the whole
+    # (dataset, n) pair with a single ``writerows`` call.
+    rows: List[List[object]] = []
+
+    if n <= SA_NAIVE_THRESHOLD:
+        structure, elapsed, memory = benchmark_construction(brute_force_suffix_array, text)
+        built_structures["sa_naive"] = structure
+        rows.append(
+            [
+                "sa_naive",
+                dataset_name,
+                n,
+                0,
+                "construction",
+                elapsed,
+                memory,
+            ]
+        )
+    else:
+        print(f"    Skipping sa_naive (n > {SA_NAIVE_THRESHOLD})")
+
+    if n <= ST_NAIVE_THRESHOLD:
+        structure, elapsed, memory = benchmark_construction(build_naive_suffix_tree, text)
+        built_structures["st_naive"] = structure
+        rows.append(
+            [
+                "st_naive",
+                dataset_name,
+                n,
+                0,
+                "construction",
+                elapsed,
+                memory,
+            ]
+        )
+    else:
+        print(f"    Skipping st_naive (n > {ST_NAIVE_THRESHOLD})")
+
+    structure, elapsed, memory = benchmark_construction(build_ukkonen_suffix_tree, text)
+    built_structures["st_ukkonen"] = structure
+    rows.append(
+        [
+            "st_ukkonen",
+            dataset_name,
+            n,
+            0,
+            "construction",
+            elapsed,
+            memory,
+        ]
+    )
+
+    structure, elapsed, memory = benchmark_construction(manber_myers_suffix_array, text)
+    built_structures["sa_manber"] = structure
+    rows.append(
+        [
+            "sa_manber_myers",
+            dataset_name,
+            n,
+            0,
+            "construction",
+            elapsed,
+            memory,
+        ]
+    )
+
+    structure, elapsed, memory = benchmark_construction(build_sa_search_index, text)
+    built_structures["sa_index"] = structure
+    rows.append(
+        [
+            "sa_index",
+            dataset_name,
+            n,
+            0,
+            "construction",
+            elapsed,
+            memory,
+        ]
+    )
+
+    for pattern in PATTERNS_TO_SEARCH:
+        m = len(pattern)
+
+        if "sa_manber" in built_structures:
+            elapsed = benchmark_query(locate_pattern, text, pattern, built_structures["sa_manber"])
+            rows.append(
+                [
+                    "sa_manber_query",
+                    dataset_name,
+                    n,
+                    m,
+                    "query",
+                    elapsed,
+                    0,
+                ]
+            )
+
+        if "sa_naive" in built_structures:
+            elapsed = benchmark_query(locate_pattern, text, pattern, built_structures["sa_naive"])
+            rows.append(
+                [
+                    "sa_naive_query",
+                    dataset_name,
+                    n,
+                    m,
+                    "query",
+                    elapsed,
+                    0,
+                ]
+            )
+
+        if "st_naive" in built_structures:
+            elapsed = benchmark_query(naive_search, built_structures["st_naive"], pattern)
+            rows.append(
+                [
+                    "st_naive_query",
+                    dataset_name,
+                    n,
+                    m,
+                    "query",
+                    elapsed,
+                    0,
+                ]
+            )
+
+        if "st_ukkonen" in built_structures:
+            elapsed = benchmark_query(ukkonen_search, built_structures["st_ukkonen"], pattern)
+            rows.append(
+                [
+                    "st_ukkonen_query",
+                    dataset_name,
+                    n,
+                    m,
+                    "query",
+                    elapsed,
+                    0,
+                ]
+            )
+
+        if "sa_index" in built_structures:
+            elapsed = benchmark_query(sa_index_search, built_structures["sa_index"], pattern)
+            rows.append(
+                [
+                    "sa_index_query",
+                    dataset_name,
+                    n,
+                    m,
+                    "query",
+                    elapsed,
+                    0,
+                ]
+            )
+
+        elapsed = benchmark_query(re.findall, pattern, text)
+        rows.append(
+            [
+                "python_regex",
+                dataset_name,
+                n,
+                m,
+                "query",
+                elapsed,
+                0,
+            ]
+        )
+
+    return rows
 
 
 if __name__ == "__main__":
     OUTPUT_CSV_FILE = "benchmark_results.csv"
-    PATTERNS_TO_SEARCH = [
-    "TCTGTGT",
-    "TAAAATTTTATTGACTTA",
-    "CACCACCATCACCATTACCAC",
-    "TTTTTTTTTT",
-    "AGCTTTTCATTCTGACTGCAACGGGCAATA",
-    "GTTACCTGCCGTGAGTAAATTAAAATTTTATTGACTTAGGTCACTAAATACTT",
-    "AACGGTGCGGGCTGACGCGTACAGGAAACACAGAAAAAAGCCCGCACCTGACAGTGCGGGCTTTTTTTTTCGACCAAAGGTAACGAGGTAACAACCATGCGA",
-    "GGCGGCAATATCGAAACTGTTGCCATCGACGGCGATTTCGATGCCTGTCAGGCGCTGGTGAAGCAGGCGTTTGATGATGAAGAACTGAAAGTGGCGCTAGGGTTAAACTCGGCTAACTCGATTAACATCAGCCGTTTGCTGGCGCAGA",
-    "GATTACAZZZ",
-    ]
-    # Run sa_naive up to n=10000 (will run on 1k, 5k, 10k)
-    SA_NAIVE_THRESHOLD: int = 100_000
-
-    # Run st_naive only up to n=2000 (will run on 1k only)
-    ST_NAIVE_THRESHOLD: int = 2_001
-    N_SIZES_FOR_LARGE_FILES = [
-        1_000,
-        2_000,
-        3_000,
-        4_000,
-        5_000,
-        10_000,
-        25_000,
-        50_000,
-        75_000,
-        100_000,
-        150_000,
-        200_000,
-    ]
 
     datasets = find_datasets()
     if not datasets:
@@ -133,8 +361,7 @@ if __name__ == "__main__":
 
     with open(OUTPUT_CSV_FILE, "w", newline="", encoding="utf-8") as handle:
         writer = csv.writer(handle)
-        write_csv_row(
-            writer,
+        writer.writerow(
             [
                 "algorithm",
                 "dataset_name",
@@ -146,167 +373,31 @@ if __name__ == "__main__":
             ],
         )
 
-        for dataset_path in datasets:
-            dataset_name = os.path.basename(dataset_path)
-            print(f"\nLoading dataset: {dataset_name}...")
-            full_text = parse_fasta_file(dataset_path)
-            full_length = len(full_text)
-
-            if full_length < N_SIZES_FOR_LARGE_FILES[-1]:
-                n_values_to_test = [full_length]
-            else:
-                n_values_to_test = N_SIZES_FOR_LARGE_FILES
-
-            for n in n_values_to_test:
-                if n > full_length:
-                    continue
-
-                text = full_text[:n]
-                print(f"  Benchmarking {dataset_name} (n={n})...")
-
-                built_structures: Dict[str, object] = {}
-
-                if n <= SA_NAIVE_THRESHOLD:
-                    structure, elapsed, memory = benchmark_construction(brute_force_suffix_array, text)
-                    built_structures["sa_naive"] = structure
-                    write_csv_row(
-                        writer,
-                        [
-                            "sa_naive",
-                            dataset_name,
-                            n,
-                            0,
-                            "construction",
-                            elapsed,
-                            memory,
-                        ],
-                    )
-                else:
-                    print(f"    Skipping sa_naive (n > {SA_NAIVE_THRESHOLD})")
-
-                if n <= ST_NAIVE_THRESHOLD:
-                    structure, elapsed, memory = benchmark_construction(build_naive_suffix_tree, text)
-                    built_structures["st_naive"] = structure
-                    write_csv_row(
-                        writer,
-                        [
-                            "st_naive",
-                            dataset_name,
-                            n,
-                            0,
-                            "construction",
-                            elapsed,
-                            memory,
-                        ],
-                    )
+        # Every (dataset, n) pair is CPU-bound and independent, so they are
+        # fanned out across processes; rows are written here as they finish.
+        # Each worker pins itself to its own core to avoid scheduler jitter.
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=pin_worker_to_core,
+            initargs=(multiprocessing.Value("i", 0),),
+        ) as pool:
+            futures = []
+            for dataset_path in datasets:
+                dataset_name = os.path.basename(dataset_path)
+                print(f"\nLoading dataset: {dataset_name}...")
+                full_text = parse_fasta_file(dataset_path)
+                full_length = len(full_text)
+
+                if full_length < N_SIZES_FOR_LARGE_FILES[-1]:
+                    n_values_to_test = [full_length]
                 else:
-                    print(f"    Skipping st_naive (n > {ST_NAIVE_THRESHOLD})")
-
-                structure, elapsed, memory = benchmark_construction(build_ukkonen_suffix_tree, text)
-                built_structures["st_ukkonen"] = structure
-                write_csv_row(
-                    writer,
-                    [
-                        "st_ukkonen",
-                        dataset_name,
-                        n,
-                        0,
-                        "construction",
-                        elapsed,
-                        memory,
-                    ],
-                )
-
-                structure, elapsed, memory = benchmark_construction(manber_myers_suffix_array, text)
-                built_structures["sa_manber"] = structure
-                write_csv_row(
-                    writer,
-                    [
-                        "sa_manber_myers",
-                        dataset_name,
-                        n,
-                        0,
-                        "construction",
-                        elapsed,
-                        memory,
-                    ],
-                )
-
-                for pattern in PATTERNS_TO_SEARCH:
-                    m = len(pattern)
-
-                    if "sa_manber" in built_structures:
-                        elapsed = benchmark_query(locate_pattern, text, pattern, built_structures["sa_manber"])
-                        write_csv_row(
-                            writer,
-                            [
-                                "sa_manber_query",
-                                dataset_name,
-                                n,
-                                m,
-                                "query",
-                                elapsed,
-                                0,
-                            ],
-                        )
-
-                    if "sa_naive" in built_structures:
-                        elapsed = benchmark_query(locate_pattern, text, pattern, built_structures["sa_naive"])
-                        write_csv_row(
-                            writer,
-                            [
-                                "sa_naive_query",
-                                dataset_name,
-                                n,
-                                m,
-                                "query",
-                                elapsed,
-                                0,
-                            ],
-                        )
-
-                    if "st_naive" in built_structures:
-                        elapsed = benchmark_query(naive_search, built_structures["st_naive"], pattern)
-                        write_csv_row(
-                            writer,
-                            [
-                                "st_naive_query",
-                                dataset_name,
-                                n,
-                                m,
-                                "query",
-                                elapsed,
-                                0,
-                            ],
-                        )
-
-                    if "st_ukkonen" in built_structures:
-                        elapsed = benchmark_query(ukkonen_search, built_structures["st_ukkonen"], pattern)
-                        write_csv_row(
-                            writer,
-                            [
-                                "st_ukkonen_query",
-                                dataset_name,
-                                n,
-                                m,
-                                "query",
-                                elapsed,
-                                0,
-                            ],
-                        )
-
-                    elapsed = benchmark_query(re.findall, pattern, text)
-                    write_csv_row(
-                        writer,
-                        [
-                            "python_regex",
-                            dataset_name,
-                            n,
-                            m,
-                            "query",
-                            elapsed,
-                            0,
-                        ],
-                    )
+                    n_values_to_test = N_SIZES_FOR_LARGE_FILES
+
+                n_values_to_test = [n for n in n_values_to_test if n <= full_length]
+                for n in n_values_to_test:
+                    futures.append(pool.submit(run_one, dataset_name, full_text[:n]))
+
+            for future in as_completed(futures):
+                writer.writerows(future.result())
 
     print(f"Benchmarks complete. Results saved to {OUTPUT_CSV_FILE}.")
@@ -9,7 +9,30 @@ explicit commentary so that each stage of the algorithm remains easy to trace.
 from __future__ import annotations
 
 import time
-from typing import Callable, Iterable, List
+from typing import Callable, List, Optional
+
+
+# 2-bit symbol codes for the DNA alphabet (A=0, C=1, G=2, T=3).  The codes
+# preserve the lexicographic order of the letters, so they can stand in for
+# ``ord`` when seeding suffix ranks.
+_DNA_ALPHABET = b"ACGT"
+_DNA_TO_2BIT = bytes.maketrans(_DNA_ALPHABET, bytes(range(len(_DNA_ALPHABET))))
+
+
+def _dna_2bit_codes(text: str) -> Optional[bytes]:
+	"""Return the 2-bit code of every character of *text*, one per byte.
+
+	Returns ``None`` when *text* contains anything outside ``ACGT`` so callers
+	can fall back to the general code path.
+	"""
+
+	try:
+		raw = text.encode("ascii")
+	except UnicodeEncodeError:
+		return None
+	if raw.translate(None, _DNA_ALPHABET):
+		return None
+	return raw.translate(_DNA_TO_2BIT)
 
 
 def brute_force_suffix_array(text: str) -> List[int]:
@@ -59,59 +82,39 @@ def manber_myers_suffix_array(text: str) -> List[int]:
 	if n == 0:
 		return []
 
-	# Initial ordering and ranks rely on single characters.
+	# Initial ordering and ranks rely on single characters.  Pure DNA is
+	# translated to dense 2-bit codes in one C-level pass, which also keeps
+	# the folded sort keys below small.
 	suffix_array = list(range(n))
-	rank = [ord(ch) for ch in text]
+	codes = _dna_2bit_codes(text)
+	rank = list(codes) if codes is not None else [ord(ch) for ch in text]
 
 	k = 1
-	def counting_sort(indices: Iterable[int], key_fn: Callable[[int], int], key_range: int) -> List[int]:
-		"""Stable counting sort specialised for suffix indices."""
-
-		indices_list = list(indices)
-		counts = [0] * key_range
-		for idx in indices_list:
-			counts[key_fn(idx)] += 1
-
-		for i in range(1, key_range):
-			counts[i] += counts[i - 1]
-
-		output = [0] * len(indices_list)
-		for idx in reversed(indices_list):
-			key = key_fn(idx)
-			counts[key] -= 1
-			output[counts[key]] = idx
-		return output
-
 	while k < n:
-		max_rank = max(rank)
-
-		# Sort by the second half (rank at idx + k).  The sentinel -1 is mapped to 0.
-		second_key_range = max_rank + 2
-		second_key = lambda idx: (rank[idx + k] + 1) if idx + k < n else 0
-		suffix_array = counting_sort(suffix_array, second_key, second_key_range)
-
-		# Sort by the first half (current rank).
-		first_key_range = max_rank + 1
-		first_key = lambda idx: rank[idx]
-		suffix_array = counting_sort(suffix_array, first_key, first_key_range)
+		# Rank of the second half (suffix starting at idx + k); -1 marks a
+		# half that runs past the end of the text.  Shifting the rank list by
+		# k and padding with -1 gathers every entry without an ``idx + k < n``
+		# test per element.
+		rank_next = rank[k:] + [-1] * k
+
+		# Fold each (rank, rank_next) pair into one integer key so that a
+		# single stable C-level sort replaces the two counting-sort passes.
+		base = max(rank) + 2
+		keys = [first * base + second + 1 for first, second in zip(rank, rank_next)]
+		suffix_array = sorted(range(n), key=keys.__getitem__)
 
 		new_rank = [0] * n
-		new_rank[suffix_array[0]] = 0
 		distinct_ranks = 0
 
 		# Walk the sorted suffix indices, emitting a new rank whenever the
-		# neighbouring (rank, next_rank) pair changes.
-		for pos in range(1, n):
-			prev_idx = suffix_array[pos - 1]
-			curr_idx = suffix_array[pos]
-
-			prev_pair = (rank[prev_idx], rank[prev_idx + k] if prev_idx + k < n else -1)
-			curr_pair = (rank[curr_idx], rank[curr_idx + k] if curr_idx + k < n else -1)
-
-			if curr_pair != prev_pair:
+		# neighbouring (rank, next_rank) pair -- i.e. its key -- changes.
+		prev_key = keys[suffix_array[0]]
+		for idx in suffix_array:
+			key = keys[idx]
+			if key != prev_key:
 				distinct_ranks += 1
-
-			new_rank[curr_idx] = distinct_ranks
+				prev_key = key
+			new_rank[idx] = distinct_ranks
 
 		rank = new_rank
 
@@ -131,11 +134,15 @@ def locate_pattern(text: str, pattern: str, suffix_array: List[int]) -> List[int
 	if not pattern:
 		return list(range(len(text)))
 
+	m = len(pattern)
+	startswith = text.startswith
+
 	def compare(index: int) -> int:
-		probe = text[index : index + len(pattern)]
-		if probe == pattern:
+		# ``startswith`` checks the window in C without materialising a slice;
+		# only a mismatching probe needs the slice to decide the ordering.
+		if startswith(pattern, index):
 			return 0
-		return -1 if probe < pattern else 1
+		return -1 if text[index : index + m] < pattern else 1
 
 	# Locate the first suffix whose prefix is >= pattern.
 	left, right = 0, len(suffix_array)
@@ -159,7 +166,9 @@ def locate_pattern(text: str, pattern: str, suffix_array: List[int]) -> List[int
 			left = mid + 1
 	last = left
 
-	return [suffix_array[i] for i in range(first, last) if text[suffix_array[i] :].startswith(pattern)]
+	# Every suffix in [first, last) is prefixed by *pattern* by construction of
+	# the two bounds, so no per-hit verification (or suffix copy) is needed.
+	return list(suffix_array[first:last])
 
 
 def _interactive_cli() -> None:
@@ -3,49 +3,120 @@
 Includes:
 1. Naive suffix tree construction - textbook strategy with O(n^2) complexity.
 2. Ukkonen's algorithm - linear time construction with optimal O(n) complexity.
+3. A suffix-array index answering the same queries for build-once,
+   search-many workloads.
 """
 
 from __future__ import annotations
 import time
+from array import array
 from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Optional
 
+from suffix_array import locate_pattern, manber_myers_suffix_array
+
+# Child-slot layout of the naive trie.  Text drawn from the DNA alphabet
+# (plus N and the '$' terminator) always uses this layout; any other text
+# gets a layout made of its own sorted symbols.  Slots follow character
+# order, so walking them visits children lexicographically.
+DNA_ALPHABET = "$ACGNT"
+_DNA_SYMBOLS = frozenset(DNA_ALPHABET)
+
+def _slot_alphabet(text: str) -> str:
+    """Return the child-slot layout for a naive trie over *text*."""
+    symbols = set(text)
+    if symbols <= _DNA_SYMBOLS:
+        return DNA_ALPHABET
+    return "".join(sorted(symbols))
+
 @dataclass
 class SuffixTreeNode:
-    """Trie node used by the naive suffix tree."""
-    children: Dict[str, "SuffixTreeNode"] = field(default_factory=dict)
-    indices: List[int] = field(default_factory=list)
+    """Trie node used by the naive suffix tree.
 
-    def add_suffix(self, text: str, start_index: int) -> None:
+    ``children`` is a fixed-size slot table indexed by the position of a
+    character in ``alphabet`` (shared by every node of a tree), which avoids
+    hashing a one-character string for each of the O(n^2) insertions.
+    ``indices`` is a packed ``array('i')`` (4 bytes per entry) rather than a
+    list of boxed ints; the naive tree stores O(n^2) of them.
+    """
+    children: List[Optional["SuffixTreeNode"]] = field(
+        default_factory=lambda: [None] * len(DNA_ALPHABET)
+    )
+    indices: array = field(default_factory=lambda: array("i"))
+    alphabet: str = DNA_ALPHABET
+
+    def add_suffix(self, codes: List[int], start_index: int) -> None:
+        """Insert the suffix at *start_index* of the slot-encoded text *codes*."""
         current = self
-        for offset in range(start_index, len(text)):
-            char = text[offset]
-            if char not in current.children:
-                current.children[char] = SuffixTreeNode()
-            current = current.children[char]
+        alphabet = self.alphabet
+        width = len(alphabet)
+        for code in codes[start_index:]:
+            child = current.children[code]
+            if child is None:
+                child = SuffixTreeNode([None] * width, array("i"), alphabet)
+                current.children[code] = child
+            current = child
             current.indices.append(start_index)
 
+    def child_items(self) -> List[Tuple[str, "SuffixTreeNode"]]:
+        """Return ``(char, child)`` pairs for the occupied slots, in order."""
+        return [
+            (char, child)
+            for char, child in zip(self.alphabet, self.children)
+            if child is not None
+        ]
+
 def build_naive_suffix_tree(text: str) -> SuffixTreeNode:
-    root = SuffixTreeNode()
+    alphabet = _slot_alphabet(text)
+    slot_of = {char: idx for idx, char in enumerate(alphabet)}
+    codes = [slot_of[char] for char in text]
+    root = SuffixTreeNode([None] * len(alphabet), alphabet=alphabet)
     for start_index in range(len(text)):
-        root.add_suffix(text, start_index)
-    root.indices = list(range(len(text)))
+        root.add_suffix(codes, start_index)
+    root.indices = array("i", range(len(text)))
     return root
 
 def naive_search(root: SuffixTreeNode, pattern: str) -> List[int]:
+    alphabet = root.alphabet
     current = root
     for char in pattern:
-        if char not in current.children:
+        slot = alphabet.find(char)
+        if slot < 0:
+            return []
+        current = current.children[slot]
+        if current is None:
             return []
-        current = current.children[char]
-    return sorted(current.indices)
+    # add_suffix is driven by an ascending loop over start_index, so every
+    # node's indices are appended in increasing order already.
+    return current.indices.tolist()
+
+# Alphabets up to this size give Ukkonen internal nodes one list slot per
+# symbol; larger ones fall back to a dict keyed by symbol code.
+_MAX_SLOT_CHILDREN = 8
+
+# Frozen trees keep presorted leaf blocks of at least this many entries;
+# queries with fewer matches than the second constant just sort directly.
+_MIN_SORTED_RUN = 32
+_MERGE_SORTED_RUNS_FROM = 1024
+
+class _ChildMap(dict):
+    """Sparse child table that reads like the slot list (None when absent)."""
+    def __missing__(self, code: int) -> None:
+        return None
 
 class UkkonenNode:
-    """Node class for a correct Ukkonen's suffix tree implementation."""
-    def __init__(self, start: int, end_ptr: List[int], suffix_index: int = -1):
+    """Node class for a correct Ukkonen's suffix tree implementation.
+
+    ``children`` is indexed by symbol code (see ``UkkonenSuffixTree.codes``).
+    Leaves never gain children during Ukkonen's construction, so they carry
+    ``None`` instead of an empty table.
+    """
+    __slots__ = ("start", "end", "children", "suffix_link", "suffix_index")
+
+    def __init__(self, start: int, end_ptr: List[int], suffix_index: int = -1, children=None):
         self.start: int = start
         self.end: List[int] = end_ptr 
-        self.children: Dict[str, UkkonenNode] = {}
+        self.children = children
         self.suffix_link: Optional[UkkonenNode] = None
         self.suffix_index: int = suffix_index
 
@@ -53,116 +124,249 @@ class UkkonenNode:
         return self.end[0] - self.start + 1
 
 class UkkonenSuffixTree:
-    """Correct O(n) Ukkonen's suffix tree construction."""
+    """Correct O(n) Ukkonen's suffix tree construction.
+
+    The tree is built online from :class:`UkkonenNode` objects and then
+    frozen into parallel arrays indexed by node id (root is 0): edge
+    ``starts``/``ends``, leaf ``suffix_indices`` (-1 for internal nodes) and
+    ``child_ids`` maps from edge symbol code to child id.  Ids follow
+    breadth-first order.  ``leaf_order`` lists the leaf suffix indices in
+    preorder, so the leaves under a node are
+    ``leaf_order[leaf_lo[node]:leaf_hi[node]]``.  Queries only walk these
+    arrays.
+    """
 
     def __init__(self, text: str):
         self.text: str = text
         self.n: int = len(text)
+        # Construction and search work on symbol codes, held as bytes when
+        # they fit: indexing yields small ints (no one-character str objects)
+        # and child lookups index a slot list instead of hashing strings.
+        self.alphabet: str = _slot_alphabet(text)
+        self._slot_of: Dict[str, int] = {char: idx for idx, char in enumerate(self.alphabet)}
+        self.codes = self._encode(text)
         self.global_end: List[int] = [-1]
-        self.root: UkkonenNode = UkkonenNode(-1, [-1])
+        self.root: Optional[UkkonenNode] = UkkonenNode(-1, [-1], children=self._empty_children())
         self.root.suffix_link = self.root
-        self.active_node: UkkonenNode = self.root
-        self.active_edge: Optional[str] = None
-        self.active_length: int = 0
-        self.remainder: int = 0
-        
-        for i in range(self.n):
-            self.tree_extend(i)
-
-    def walk_down(self, node: UkkonenNode) -> bool:
-        edge_len = node.edge_len()
-        if self.active_length >= edge_len:
-            self.active_length -= edge_len
-            self.active_node = node
-            if self.active_length > 0:
-                next_char_idx = node.start + edge_len
-                if next_char_idx < self.n:
-                    self.active_edge = self.text[next_char_idx]
+
+        self._build()
+        self._freeze()
+
+    def _freeze(self) -> None:
+        """Flatten the node graph into arrays and release the node objects."""
+        self.starts = array("i")
+        self.ends = array("i")
+        self.suffix_indices = array("i")
+        self.child_ids: List[Dict[int, int]] = []
+
+        # Breadth-first walk: ids are handed out level by level, so the
+        # root and the top of the tree (shared by every query) sit together
+        # at the front of the arrays, and every child id exceeds its parent's.
+        queue: List[UkkonenNode] = [self.root]
+        for node in queue:
+            self.starts.append(node.start)
+            self.ends.append(node.end[0])
+            self.suffix_indices.append(node.suffix_index)
+            child_map: Dict[int, int] = {}
+            children = node.children
+            if children is not None:
+                if isinstance(children, dict):
+                    order = sorted(children)
                 else:
-                    # Reached the end of the text (leaf edge); reset state.
-                    self.active_length = 0
-                    self.active_edge = None
-            else:
-                self.active_edge = None
-            return True
-        return False
-
-    def tree_extend(self, text_idx: int) -> None:
-        char = self.text[text_idx]
-        self.global_end[0] = text_idx
-        self.remainder += 1
-        last_new_node: Optional[UkkonenNode] = None
-
-        while self.remainder > 0:
-            if self.active_length == 0:
-                self.active_edge = char
-
-            if self.active_edge not in self.active_node.children:
-                # Rule 2: Create a new leaf
-                new_leaf = UkkonenNode(text_idx, self.global_end, suffix_index = text_idx - (self.remainder - 1))
-                self.active_node.children[self.active_edge] = new_leaf
-                if last_new_node:
-                    last_new_node.suffix_link = self.active_node
-                    last_new_node = None
+                    order = range(len(children))
+                for code in order:
+                    child = children[code]
+                    if child is not None:
+                        child_map[code] = len(queue)
+                        queue.append(child)
+            self.child_ids.append(child_map)
+
+        # Leaf counts bottom-up (reverse id order visits children first),
+        # then preorder leaf ranges top-down: a node's children split its
+        # range in child-map order.
+        node_count = len(queue)
+        leaf_count = [0] * node_count
+        for node_id in range(node_count - 1, -1, -1):
+            children = self.child_ids[node_id]
+            if children:
+                leaf_count[node_id] = sum(leaf_count[child] for child in children.values())
+            elif self.suffix_indices[node_id] != -1:
+                leaf_count[node_id] = 1
+
+        self.leaf_order = array("i", [0]) * leaf_count[0]
+        self.leaf_lo = array("i", [0]) * node_count
+        self.leaf_hi = array("i", leaf_count)
+        for node_id in range(node_count):
+            lo = self.leaf_lo[node_id]
+            self.leaf_hi[node_id] += lo
+            children = self.child_ids[node_id]
+            if not children and leaf_count[node_id]:
+                self.leaf_order[lo] = self.suffix_indices[node_id]
+            for child in children.values():
+                self.leaf_lo[child] = lo
+                lo += leaf_count[child]
+
+        # Merge-sort tree over leaf_order: sorted_runs[i] is leaf_order with
+        # every aligned block of _MIN_SORTED_RUN << i entries sorted.  The
+        # first level sorts its blocks directly; each later level sorts
+        # blocks made of two sorted halves of the level below, which timsort
+        # merges in linear time.
+        self.sorted_runs: List[array] = []
+        size = _MIN_SORTED_RUN
+        level = self.leaf_order
+        while True:
+            merged = array("i")
+            for block_start in range(0, len(level), size):
+                block = level[block_start:block_start + size].tolist()
+                block.sort()
+                merged.extend(block)
+            self.sorted_runs.append(merged)
+            level = merged
+            if size >= len(self.leaf_order):
+                break
+            size *= 2
+
+        self.root = None
+
+    def _encode(self, text: str):
+        """Map *text* to symbol codes (bytes when the alphabet allows)."""
+        codes = [self._slot_of[char] for char in text]
+        return bytes(codes) if len(self.alphabet) <= 256 else codes
+
+    def _sorted_leaves(self, lo: int, hi: int) -> List[int]:
+        """Return ``leaf_order[lo:hi]`` in increasing order.
+
+        Large ranges are split into aligned power-of-two blocks, each taken
+        presorted from ``sorted_runs``; sorting the concatenation then only
+        has to merge O(log n) runs.
+        """
+        if hi - lo < _MERGE_SORTED_RUNS_FROM:
+            return sorted(self.leaf_order[lo:hi])
+
+        top_size = _MIN_SORTED_RUN << (len(self.sorted_runs) - 1)
+        results: List[int] = []
+        pos = lo
+        while pos < hi:
+            # Largest aligned block that starts at pos and fits in [pos, hi)
+            size = min(1 << ((hi - pos).bit_length() - 1), top_size)
+            if pos:
+                size = min(size, pos & -pos)
+            if size < _MIN_SORTED_RUN:
+                results.extend(self.leaf_order[pos:pos + size])
             else:
-                # Rule 3: Match/Split
-                next_node = self.active_node.children[self.active_edge]
-                if self.walk_down(next_node):
-                    continue 
-                if self.text[next_node.start + self.active_length] == char:
-                    # Rule 3, Case 1
-                    self.active_length += 1
-                    if last_new_node:
-                        last_new_node.suffix_link = self.active_node
+                level = (size // _MIN_SORTED_RUN).bit_length() - 1
+                results.extend(self.sorted_runs[level][pos:pos + size])
+            pos += size
+        results.sort()
+        return results
+
+    def _empty_children(self):
+        """Return a child table for a new internal node."""
+        if len(self.alphabet) <= _MAX_SLOT_CHILDREN:
+            return [None] * len(self.alphabet)
+        return _ChildMap()
+
+    def _build(self) -> None:
+        """Run one Ukkonen extension phase per text position.
+
+        The active point (node, edge, length) and the remainder live in
+        locals for the whole build rather than on ``self``, and walk-down is
+        inlined, which keeps attribute traffic out of the innermost loop.
+        """
+        codes = self.codes
+        global_end = self.global_end
+        root = self.root
+        empty_children = self._empty_children
+
+        active_node = root
+        active_edge: Optional[int] = None
+        active_length = 0
+        remainder = 0
+
+        for text_idx in range(self.n):
+            char = codes[text_idx]
+            global_end[0] = text_idx
+            remainder += 1
+            last_new_node: Optional[UkkonenNode] = None
+
+            while remainder > 0:
+                if active_length == 0:
+                    active_edge = char
+
+                next_node = active_node.children[active_edge]
+                if next_node is None:
+                    # Rule 2: Create a new leaf
+                    active_node.children[active_edge] = UkkonenNode(
+                        text_idx, global_end, text_idx - remainder + 1
+                    )
+                    if last_new_node is not None:
+                        last_new_node.suffix_link = active_node
                         last_new_node = None
-                    break 
-                
-                # Rule 3, Case 2
-                split_end = [next_node.start + self.active_length - 1]
-                split_node = UkkonenNode(next_node.start, split_end, suffix_index = -1)
-                self.active_node.children[self.active_edge] = split_node
-                new_leaf = UkkonenNode(text_idx, self.global_end, suffix_index = text_idx - (self.remainder - 1))
-                split_node.children[char] = new_leaf
-                next_node.start += self.active_length
-                split_node.children[self.text[next_node.start]] = next_node
-                if last_new_node:
-                    last_new_node.suffix_link = split_node
-                last_new_node = split_node
-
-            self.remainder -= 1
-            if self.active_node == self.root and self.active_length > 0:
-                self.active_length -= 1
-                self.active_edge = self.text[text_idx - self.remainder + 1]
-            else:
-                self.active_node = self.active_node.suffix_link if self.active_node.suffix_link else self.root
-
-    def _search_path(self, pattern: str) -> Optional[UkkonenNode]:
-        """Traverses the tree for the pattern. Returns end node or None."""
-        node = self.root
+                else:
+                    # Walk down past edges the active length covers.
+                    edge_len = next_node.end[0] - next_node.start + 1
+                    if active_length >= edge_len:
+                        active_length -= edge_len
+                        active_node = next_node
+                        # The remaining active string is the last
+                        # active_length characters before the current end.
+                        active_edge = codes[text_idx - active_length] if active_length > 0 else None
+                        continue
+
+                    # Rule 3: Match/Split
+                    if codes[next_node.start + active_length] == char:
+                        # Rule 3, Case 1
+                        active_length += 1
+                        if last_new_node is not None:
+                            last_new_node.suffix_link = active_node
+                        break
+
+                    # Rule 3, Case 2
+                    split_end = [next_node.start + active_length - 1]
+                    split_node = UkkonenNode(next_node.start, split_end, -1, empty_children())
+                    active_node.children[active_edge] = split_node
+                    split_node.children[char] = UkkonenNode(
+                        text_idx, global_end, text_idx - remainder + 1
+                    )
+                    next_node.start += active_length
+                    split_node.children[codes[next_node.start]] = next_node
+                    if last_new_node is not None:
+                        last_new_node.suffix_link = split_node
+                    last_new_node = split_node
+
+                remainder -= 1
+                if active_node is root and active_length > 0:
+                    active_length -= 1
+                    active_edge = codes[text_idx - remainder + 1]
+                else:
+                    active_node = active_node.suffix_link or root
+
+    def _search_path(self, pattern: str) -> int:
+        """Traverses the tree for the pattern. Returns end node id or -1."""
+        try:
+            pattern = self._encode(pattern)
+        except KeyError:
+            return -1  # A symbol that never occurs in the text
+        codes = self.codes
+        starts = self.starts
+        ends = self.ends
+        child_ids = self.child_ids
+        node = 0
         pat_idx = 0
-        while pat_idx < len(pattern):
-            char = pattern[pat_idx]
-            if char not in node.children:
-                return None
-            child = node.children[char]
-            edge_len = child.edge_len()
-            for i in range(edge_len):
-                if pat_idx + i >= len(pattern):
-                    return child
-                if self.text[child.start + i] != pattern[pat_idx + i]:
-                    return None
-            pat_idx += edge_len
+        pat_len = len(pattern)
+        while pat_idx < pat_len:
+            child = child_ids[node].get(pattern[pat_idx])
+            if child is None:
+                return -1
+            start = starts[child]
+            # Compare the whole edge (or the rest of the pattern) in one slice
+            step = min(ends[child] - start + 1, pat_len - pat_idx)
+            if codes[start:start + step] != pattern[pat_idx:pat_idx + step]:
+                return -1
+            pat_idx += step
             node = child
         return node
 
-    def _collect_leaves(self, node: UkkonenNode, results: List[int]) -> None:
-        """Recursively collect suffix_index from all leaves under this node."""
-        if node.suffix_index != -1:  # This is a leaf
-            results.append(node.suffix_index)
-            return
-        for child in node.children.values():
-            self._collect_leaves(child, results)
-
     def search_pattern(self, pattern: str) -> List[int]:
         """Return all starting indices for *pattern*."""
         
@@ -174,17 +378,14 @@ class UkkonenSuffixTree:
         # 1. Find the node where the pattern path ends
         node = self._search_path(pattern)
         
-        if node is None:
+        if node == -1:
             return []  # Pattern not found
         
-        # 2. Collect all leaf indices under that node
-        results: List[int] = []
-        self._collect_leaves(node, results)
-        
+        # 2. The leaves under that node are a contiguous run of leaf_order
         # The naive tree (on "text$") includes all matching indices.
         # This implementation must also include all of them.
         # The previous filtering was incorrect for this test.
-        return sorted(results)
+        return self._sorted_leaves(self.leaf_lo[node], self.leaf_hi[node])
 
 
 def build_ukkonen_suffix_tree(text: str) -> UkkonenSuffixTree:
@@ -195,14 +396,49 @@ def build_ukkonen_suffix_tree(text: str) -> UkkonenSuffixTree:
     if not text.endswith("$"):
         text += "$"
     
-    tree = UkkonenSuffixTree(text)
-    return tree
+    return UkkonenSuffixTree(text)
 
 
 def ukkonen_search(tree: UkkonenSuffixTree, pattern: str) -> List[int]:
     """Return all starting indices for *pattern* using Ukkonen's suffix tree."""
     return tree.search_pattern(pattern)
 
+
+class SASearchIndex:
+    """Suffix array over the text, searched with two binary searches.
+
+    Holds the same information as the suffix tree's leaf order in one
+    ``array('i')`` (4 bytes per character) instead of a node graph, and
+    answers :meth:`UkkonenSuffixTree.search_pattern` queries with
+    ``locate_pattern``.
+    """
+
+    def __init__(self, text: str):
+        self.text: str = text
+        self.n: int = len(text)
+        self.suffix_array = array("i", manber_myers_suffix_array(text))
+
+    def search_pattern(self, pattern: str) -> List[int]:
+        """Return all starting indices for *pattern*, in increasing order."""
+        if not pattern:
+            return list(range(self.n))
+        return sorted(locate_pattern(self.text, pattern, self.suffix_array))
+
+
+def build_sa_search_index(text: str) -> SASearchIndex:
+    """
+    Construct a suffix-array search index.
+    Appends a unique terminal '$' to the text, like the Ukkonen builder.
+    """
+    if not text.endswith("$"):
+        text += "$"
+    return SASearchIndex(text)
+
+
+def sa_index_search(index: SASearchIndex, pattern: str) -> List[int]:
+    """Return all starting indices for *pattern* using a suffix-array index."""
+    return index.search_pattern(pattern)
+
 def _interactive_cli() -> None:
     """Drive a small REPL for building and querying suffix trees."""
 
@@ -258,9 +494,11 @@ __all__ = [
     "SuffixTreeNode",
     "build_naive_suffix_tree",
     "naive_search",
-    "UkkonenState"
     "UkkonenNode",
     "UkkonenSuffixTree",
     "build_ukkonen_suffix_tree",
     "ukkonen_search",
+    "SASearchIndex",
+    "build_sa_search_index",
+    "sa_index_search",
 ]
\ No newline at end of file
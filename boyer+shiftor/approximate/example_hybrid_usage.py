@@ -67,7 +67,10 @@ def example_3_threshold_comparison():
               f"(Exact: {stats['exact_matches']}, "
               f"Approx: {stats['approximate_matches']})")
         print(f"Shift-Or triggers: {stats['shift_or_triggers']}")
-        print(f"Trigger rate: {stats['shift_or_triggers']/stats['boyer_moore_scans']*100:.1f}%")
+        if stats['boyer_moore_scans'] > 0:
+            print(f"Trigger rate: {stats['shift_or_triggers']/stats['boyer_moore_scans']*100:.1f}%")
+        else:
+            print("No Boyer-Moore scan: matches found with bytes.find")
 
 
 def example_4_read_fasta():
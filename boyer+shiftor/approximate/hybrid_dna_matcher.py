@@ -8,8 +8,12 @@ Author: STARK_5 Analysis Group
 Date: November 2025
 """
 
+from concurrent.futures import ProcessPoolExecutor
+
 from boyer_moore import BoyerMoore
-from shift_or_approximate import shift_or_approximate_search
+from shift_or_approximate import (
+    build_masks, run as run_shift_or, validate_pattern
+)
 
 
 def calculate_partial_match_density(text, pattern, position):
@@ -32,18 +36,260 @@ def calculate_partial_match_density(text, pattern, position):
     if position + m > n:
         return 0.0, 0, m
 
-    # Compare from right to left (Boyer-Moore style)
-    matched = 0
-    for i in range(m - 1, -1, -1):
-        if text[position + i] == pattern[i]:
-            matched += 1
-        else:
-            break  # Stop at first mismatch
+    # Compare from right to left (Boyer-Moore style), all lanes at once:
+    # each character is a 32-bit little-endian lane of one integer, so the
+    # highest set bit of window ^ pattern marks the rightmost mismatch.
+    window = text[position:position + m].encode("utf-32-le")
+    diff = (int.from_bytes(window, "little")
+            ^ int.from_bytes(pattern.encode("utf-32-le"), "little"))
+    matched = m - 1 - ((diff.bit_length() - 1) >> 5)
 
     pmd = matched / m if m > 0 else 0.0
     return pmd, matched, m
 
 
+# Symbols BoyerMoore's bad-character table knows (text is upper-cased)
+_BAD_CHAR_SYMBOLS = b"ACGTN"
+
+
+def _min_matched_for_threshold(m, pmd_threshold):
+    """Smallest matched-suffix length whose PMD reaches the threshold."""
+    return next((c for c in range(m + 1) if c / m >= pmd_threshold), m + 1)
+
+
+def _high_pmd_positions(text, pattern, pmd_threshold):
+    """
+    Yield every exact match or position whose PMD reaches the threshold.
+
+    PMD >= threshold exactly when the last c = _min_matched_for_threshold
+    characters of the window equal the last c characters of the pattern,
+    so the candidates are the occurrences of that pattern suffix, found
+    with str.find instead of a per-position comparison loop.
+
+    Args:
+        text: DNA sequence
+        pattern: Pattern to match
+        pmd_threshold: PMD threshold for triggering Shift-Or
+
+    Yields:
+        Window start positions in increasing order
+    """
+    n = len(text)
+    m = len(pattern)
+    c = min(_min_matched_for_threshold(m, pmd_threshold), m)
+
+    if c == 0:
+        yield from range(n - m + 1)
+        return
+
+    suffix = pattern[m - c:]
+    find = text.find
+    hit = find(suffix, m - c)
+    while hit != -1:
+        yield hit - (m - c)
+        hit = find(suffix, hit + 1)
+
+
+def _exact_hits_without_triggers(text, pattern, pmd_threshold):
+    """
+    Return every exact match position if no position can trigger Shift-Or.
+
+    Uses _high_pmd_positions, so the whole check runs in C-level find calls
+    and stops at the first high-PMD position that is not an exact match.
+    Patterns with symbols outside the BoyerMoore bad-character table
+    ('ACGTN', any case) are left to the scan, whose shifts can step over
+    some of their occurrences.
+
+    Returns:
+        Sorted list of exact match positions, or None if a trigger is
+        possible or the pattern has symbols outside 'ACGTN'
+    """
+    if not set(pattern.upper()) <= set(_BAD_CHAR_SYMBOLS):
+        return None
+
+    hits = []
+    startswith = text.startswith
+    for i in _high_pmd_positions(text, pattern, pmd_threshold):
+        if not startswith(pattern, i):
+            return None
+        hits.append(i)
+    return hits
+
+
+def _encode_dna(text):
+    """Return the ASCII bytes of a DNA string for byte-level scanning."""
+    return text.encode("ascii")
+
+
+def _bad_character_table(bm):
+    """
+    Flatten a BoyerMoore bad-character table for byte-level lookups.
+
+    Entry ``j * 256 + byte`` holds the shift for a mismatch against ``byte``
+    at pattern index ``j``, following BoyerMoore._get_bad_char_shift: the
+    text character is upper-cased and anything outside the table counts as
+    'N'. Shifts are at least 1 so the scan always advances.
+
+    Args:
+        bm: BoyerMoore instance for the pattern
+
+    Returns:
+        Flat list of m * 256 shifts
+    """
+    table = bm.bad_char_table
+    rightmost_by_byte = [
+        table.get(chr(byte).upper(), table['N']) for byte in range(256)
+    ]
+
+    shifts = []
+    for j in range(bm.pattern_length):
+        shifts.extend(max(j - rightmost[j], 1) for rightmost in rightmost_by_byte)
+    return shifts
+
+
+def _bm_pmd_scan(text, pattern, bad_char, pmd_threshold, trace_skips=False,
+                 start=0, stop=None):
+    """
+    Boyer-Moore scan with the PMD trigger over byte-encoded text.
+
+    This is the Cruiser loop of HybridDNAMatcher.search with statistics kept
+    in locals. Positions that need Python-level handling are returned as
+    events instead of being processed inline.
+
+    Args:
+        text: Byte-encoded DNA sequence
+        pattern: Byte-encoded pattern
+        bad_char: Flat shift table from _bad_character_table
+        pmd_threshold: PMD threshold for triggering Shift-Or
+        trace_skips: Also record bad-character skips longer than 1
+        start: Alignment the scan starts from
+        stop: Scan alignments below this bound (default: every alignment)
+
+    Returns:
+        Tuple of (events, positions_scanned, characters_compared, next_i)
+        events: List of (position, matched_chars, shift) in scan order;
+                matched_chars == m marks an exact match, shift == 1 a
+                PMD trigger and shift > 1 a recorded skip
+        next_i: First alignment at or beyond stop the scan landed on
+    """
+    n = len(text)
+    m = len(pattern)
+
+    min_matched = _min_matched_for_threshold(m, pmd_threshold)
+
+    events = []
+    scans = 0
+    compared = 0
+    end = n - m + 1 if stop is None else min(stop, n - m + 1)
+    i = start
+
+    while i < end:
+        scans += 1
+
+        j = m - 1
+        while j >= 0 and pattern[j] == text[i + j]:
+            j -= 1
+
+        if j < 0:
+            compared += m
+            events.append((i, m, 1))
+            i += 1
+            continue
+
+        compared += m - j
+
+        # PMD numerator: the right-to-left compare above already stopped at
+        # the first mismatch, so everything to its right matched.
+        matched = m - 1 - j
+
+        if matched >= min_matched:
+            events.append((i, matched, 1))
+            i += 1
+        else:
+            shift = bad_char[j * 256 + text[i + j]]
+            if trace_skips and shift > 1:
+                events.append((i, matched, shift))
+            i += shift
+
+    return events, scans, compared, i
+
+
+def _scan_chunk(window, pattern, bad_char, pmd_threshold, offset):
+    """Process-pool worker: _bm_pmd_scan over a window starting at text[offset]."""
+    events, scans, compared, next_i = _bm_pmd_scan(
+        window, pattern, bad_char, pmd_threshold
+    )
+    events = [(offset + i, matched, shift) for i, matched, shift in events]
+    return events, scans, compared, offset + next_i
+
+
+# Texts shorter than this scan sequentially even when workers > 1: the
+# sequential scan covers roughly 10 Mbp/s, so below it shipping the text to
+# the workers (and, on first use, starting them) costs more than it saves.
+_PARALLEL_MIN_TEXT = 2_000_000
+
+
+def _parallel_bm_pmd_scan(text, pattern, bad_char, pmd_threshold, pool, workers):
+    """
+    Run _bm_pmd_scan over equal chunks in worker processes.
+
+    Boyer-Moore alignments depend on where a scan starts, so each chunk is
+    stitched onto the scan arriving from the previous one: both paths are
+    advanced until they land on the same alignment, after which they
+    coincide and the chunk's own results are used. Events and counters are
+    therefore identical to one sequential scan.
+
+    Args:
+        pool: ProcessPoolExecutor that runs the chunks
+        workers: Number of chunks to split the text into
+
+    Returns:
+        Same tuple as _bm_pmd_scan
+    """
+    positions = len(text) - len(pattern) + 1
+    size = -(-positions // workers)
+    bounds = [(lo, min(lo + size, positions)) for lo in range(0, positions, size)]
+
+    # Each worker is sent only the bytes its alignments can read
+    m = len(pattern)
+    futures = [
+        pool.submit(_scan_chunk, text[lo:hi + m - 1], pattern, bad_char,
+                    pmd_threshold, lo)
+        for lo, hi in bounds
+    ]
+    chunks = [future.result() for future in futures]
+
+    events, scans, compared, seq = chunks[0]
+    for (chunk_events, chunk_scans, chunk_compared, chunk_next), (lo, hi) in zip(chunks[1:], bounds[1:]):
+        # seq: where the sequential scan enters this chunk; own: the chunk's
+        # path, whose events/counters before the meeting point are skipped
+        own = lo
+        skip_events = skip_scans = skip_compared = 0
+        while seq < hi and seq != own:
+            if own < seq:
+                part, sc, co, own = _bm_pmd_scan(
+                    text, pattern, bad_char, pmd_threshold, start=own, stop=seq
+                )
+                skip_events += len(part)
+                skip_scans += sc
+                skip_compared += co
+            else:
+                part, sc, co, seq = _bm_pmd_scan(
+                    text, pattern, bad_char, pmd_threshold, start=seq, stop=min(own, hi)
+                )
+                events.extend(part)
+                scans += sc
+                compared += co
+
+        if seq < hi:
+            events.extend(chunk_events[skip_events:])
+            scans += chunk_scans - skip_scans
+            compared += chunk_compared - skip_compared
+            seq = chunk_next
+
+    return events, scans, compared, seq
+
+
 class HybridDNAMatcher:
     """
     Heuristic-driven hybrid DNA pattern matcher.
@@ -54,16 +300,21 @@ class HybridDNAMatcher:
     Switching trigger: Partial Match Density (PMD) threshold
     """
 
-    def __init__(self, pmd_threshold=0.75, k_errors=1):
+    def __init__(self, pmd_threshold=0.75, k_errors=1, workers=1):
         """
         Initialize the hybrid matcher.
 
         Args:
             pmd_threshold: PMD threshold for triggering Shift-Or (default: 0.75)
             k_errors: Maximum errors allowed in approximate matching (default: 1)
+            workers: Processes for the Boyer-Moore scan in search() on texts
+                     of at least _PARALLEL_MIN_TEXT bp (default: 1). The
+                     process pool is started on first use and kept until
+                     close().
         """
         self.pmd_threshold = pmd_threshold
         self.k_errors = k_errors
+        self.workers = workers
 
         # Statistics tracking
         self.stats = {
@@ -72,10 +323,52 @@ class HybridDNAMatcher:
             'exact_matches': 0,
             'approximate_matches': 0,
             'total_positions_scanned': 0,
-            'total_characters_compared': 0
+            'total_characters_compared': 0,
+            'find_path_searches': 0
         }
 
-    def search(self, text, pattern, verbose=False):
+        # Per-pattern tables, reused while the same pattern is searched again
+        self._tables_key = None
+        self._tables = None
+
+        # Worker processes for the parallel scan, shared across searches
+        self._pool = None
+
+    def _worker_pool(self):
+        """Return the matcher's process pool, starting it on first use."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def close(self):
+        """Shut down the worker processes, if any were started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _pattern_tables(self, pattern):
+        """
+        Return the (bad_char, so_masks, so_error) tables for a pattern.
+
+        All are built once per pattern and kept until a different pattern
+        (or k_errors) is searched, so repeated queries skip the BoyerMoore
+        preprocessing. If Shift-Or rejects the pattern or k_errors, so_masks
+        is None and so_error holds the reason; triggers then skip Shift-Or.
+        """
+        key = (pattern, self.k_errors)
+        if key != self._tables_key:
+            bad_char = _bad_character_table(BoyerMoore(pattern))
+            try:
+                validate_pattern(pattern, self.k_errors)
+            except ValueError as e:
+                so_masks, so_error = None, str(e)
+            else:
+                so_masks, so_error = build_masks(pattern), None
+            self._tables = (bad_char, so_masks, so_error)
+            self._tables_key = key
+        return self._tables
+
+    def search(self, text, pattern, verbose=False, collect_stats=True):
         """
         Search for pattern in text using hybrid approach.
 
@@ -83,10 +376,18 @@ class HybridDNAMatcher:
             text: DNA sequence to search in
             pattern: DNA pattern to search for
             verbose: Print detailed state transitions
+            collect_stats: Add this search to the statistics (default: True)
 
         Returns:
             List of tuples: (position, match_type, error_count)
             match_type: 'exact' or 'approximate'
+
+        When no position in the text can reach the PMD threshold without
+        being an exact match, Shift-Or can never trigger, so a non-verbose
+        search collects the exact matches with bytes.find instead of the
+        Boyer-Moore scan. Such searches are counted in 'find_path_searches'
+        and add to the match counters only; no scan ran, so scans,
+        positions and comparisons are left unchanged.
         """
         n = len(text)
         m = len(pattern)
@@ -94,11 +395,24 @@ class HybridDNAMatcher:
         if m > n or m == 0:
             return []
 
-        # Initialize Boyer-Moore for this pattern
-        bm = BoyerMoore(pattern)
+        text_b = _encode_dna(text)
+        pattern_b = _encode_dna(pattern)
+
+        # Verbose runs always scan so the skip trace is printed
+        if not verbose:
+            exact_hits = _exact_hits_without_triggers(
+                text_b, pattern_b, self.pmd_threshold
+            )
+            if exact_hits is not None:
+                if collect_stats:
+                    self.stats['find_path_searches'] += 1
+                    self.stats['exact_matches'] += len(exact_hits)
+                return [(i, 'exact', 0) for i in exact_hits]
+
+        # Shift-Or masks are built once per pattern, not once per trigger
+        bad_char, so_masks, so_error = self._pattern_tables(pattern)
 
         matches = []
-        i = 0  # Current position in text
 
         if verbose:
             print(f"\n{'='*70}")
@@ -110,89 +424,83 @@ class HybridDNAMatcher:
             print(f"Max errors (k): {self.k_errors}")
             print(f"{'='*70}\n")
 
-        while i <= n - m:
-            self.stats['total_positions_scanned'] += 1
-            self.stats['boyer_moore_scans'] += 1
-
-            # STATE 1: Boyer-Moore (The Cruiser)
-            # Check for exact match at current position
-            exact_match = True
-            j = m - 1  # Start from end of pattern
-
-            while j >= 0:
-                self.stats['total_characters_compared'] += 1
-                if pattern[j] != text[i + j]:
-                    exact_match = False
-                    break
-                j -= 1
-
-            if exact_match:
+        # STATE 1: Boyer-Moore (The Cruiser) runs as one byte-level scan;
+        # only exact hits and PMD triggers come back to Python. Verbose runs
+        # stay sequential so the skip trace is complete.
+        if self.workers > 1 and not verbose and n >= _PARALLEL_MIN_TEXT:
+            events, scans, compared, _ = _parallel_bm_pmd_scan(
+                text_b, pattern_b, bad_char, self.pmd_threshold,
+                self._worker_pool(), self.workers
+            )
+        else:
+            events, scans, compared, _ = _bm_pmd_scan(
+                text_b, pattern_b, bad_char,
+                self.pmd_threshold, trace_skips=verbose
+            )
+        # Counters stay local and are written back to self.stats once
+        exact_count = 0
+        trigger_count = 0
+        approx_count = 0
+        k_errors = self.k_errors
+
+        for i, matched_chars, shift in events:
+            if matched_chars == m:
                 # Exact match found
                 matches.append((i, 'exact', 0))
-                self.stats['exact_matches'] += 1
+                exact_count += 1
 
                 if verbose:
                     print(f"[POS {i:6d}] ✓ EXACT MATCH (Boyer-Moore)")
+                continue
 
-                i += 1
+            pmd = matched_chars / m
+
+            if shift > 1:
+                # Low PMD → Boyer-Moore skip (only recorded when verbose)
+                print(f"[POS {i:6d}] ⏩ SKIP {shift} positions "
+                      f"(PMD={pmd:.2f} < {self.pmd_threshold})")
                 continue
 
-            # No exact match - calculate PMD
-            pmd, matched_chars, total_chars = calculate_partial_match_density(
-                text, pattern, i
-            )
+            # High PMD but not exact → potential mutation site
+            # STATE 2: Shift-Or (The Investigator)
+            trigger_count += 1
 
-            # THE HEURISTIC TRIGGER
-            if pmd >= self.pmd_threshold:
-                # High PMD but not exact → potential mutation site
-                # STATE 2: Shift-Or (The Investigator)
-                self.stats['shift_or_triggers'] += 1
+            if verbose:
+                print(f"[POS {i:6d}] 🔍 PMD={pmd:.2f} ({matched_chars}/{m}) "
+                      f"→ TRIGGER Shift-Or")
 
+            # Run Shift-Or approximate matching on the window in place
+            if so_masks is None:
                 if verbose:
-                    print(f"[POS {i:6d}] 🔍 PMD={pmd:.2f} ({matched_chars}/{total_chars}) "
-                          f"→ TRIGGER Shift-Or")
-
-                # Extract window for approximate matching
-                window_start = i
-                window_end = min(i + m + self.k_errors, n)
-                window = text[window_start:window_end]
-
-                # Run Shift-Or approximate matching
-                try:
-                    approx_matches = shift_or_approximate_search(
-                        window, 
-                        pattern, 
-                        self.k_errors
-                    )
-
-                    if approx_matches:
-                        for local_pos, errors in approx_matches:
-                            global_pos = window_start + local_pos
-                            matches.append((global_pos, 'approximate', errors))
-                            self.stats['approximate_matches'] += 1
-
-                            if verbose:
-                                print(f"[POS {global_pos:6d}] ≈ APPROX MATCH "
-                                      f"(Shift-Or, k={errors})")
-                except Exception as e:
-                    if verbose:
-                        print(f"[POS {i:6d}] ⚠ Shift-Or error: {e}")
-
-                i += 1  # Move forward by 1
-            else:
-                # Low PMD → use Boyer-Moore shift
-                # Use bad character rule to determine shift
-                if j >= 0:
-                    bad_char = text[i + j]
-                    shift = bm.bad_character_shift(j, bad_char)
-                else:
-                    shift = 1
+                    print(f"[POS {i:6d}] ⚠ Shift-Or error: {so_error}")
+                continue
 
-                if verbose and shift > 1:
-                    print(f"[POS {i:6d}] ⏩ SKIP {shift} positions "
-                          f"(PMD={pmd:.2f} < {self.pmd_threshold})")
+            window_end = min(i + m + k_errors, n)
+            try:
+                approx_matches = run_shift_or(
+                    so_masks, text_b, m, k_errors, i, window_end
+                )
+
+                if approx_matches:
+                    for global_pos, errors in approx_matches:
+                        matches.append((global_pos, 'approximate', errors))
+                        approx_count += 1
+
+                        if verbose:
+                            print(f"[POS {global_pos:6d}] ≈ APPROX MATCH "
+                                  f"(Shift-Or, k={errors})")
+            except Exception as e:
+                if verbose:
+                    print(f"[POS {i:6d}] ⚠ Shift-Or error: {e}")
 
-                i += shift
+        if collect_stats:
+            stats = self.stats
+            stats['total_positions_scanned'] += scans
+            stats['boyer_moore_scans'] += scans
+            stats['total_characters_compared'] += compared
+            stats['exact_matches'] += exact_count
+            stats['shift_or_triggers'] += trigger_count
+            stats['approximate_matches'] += approx_count
 
         if verbose:
             print(f"\n{'='*70}")
@@ -222,41 +530,47 @@ class HybridDNAMatcher:
         if m > n or m == 0:
             return []
 
-        bm = BoyerMoore(pattern)
         matches = []
-
-        for i in range(n - m + 1):
-            self.stats['total_positions_scanned'] += 1
-
+        _, so_masks, _ = self._pattern_tables(pattern)
+        text_b = _encode_dna(text)
+        startswith = text.startswith
+        k_errors = self.k_errors
+        exact_count = 0
+        trigger_count = 0
+        approx_count = 0
+
+        # Only positions whose PMD clears the threshold need any work
+        for i in _high_pmd_positions(text, pattern, self.pmd_threshold):
             # Check exact match
-            if bm.match_at_position(text, i):
+            if startswith(pattern, i):
                 matches.append((i, 'exact', 0))
-                self.stats['exact_matches'] += 1
+                exact_count += 1
                 continue
 
-            # Calculate PMD
-            pmd, _, _ = calculate_partial_match_density(text, pattern, i)
+            # High PMD but not exact → trigger Shift-Or
+            trigger_count += 1
+            if so_masks is None:
+                continue
 
-            # Trigger Shift-Or if PMD is high
-            if pmd >= self.pmd_threshold:
-                self.stats['shift_or_triggers'] += 1
+            window_end = min(i + m + k_errors, n)
 
-                window_start = i
-                window_end = min(i + m + self.k_errors, n)
-                window = text[window_start:window_end]
+            try:
+                approx_matches = run_shift_or(
+                    so_masks, text_b, m, k_errors, i, window_end
+                )
 
-                try:
-                    approx_matches = shift_or_approximate_search(
-                        window, pattern, self.k_errors
-                    )
+                if approx_matches:
+                    for global_pos, errors in approx_matches:
+                        matches.append((global_pos, 'approximate', errors))
+                        approx_count += 1
+            except:
+                pass
 
-                    if approx_matches:
-                        for local_pos, errors in approx_matches:
-                            global_pos = window_start + local_pos
-                            matches.append((global_pos, 'approximate', errors))
-                            self.stats['approximate_matches'] += 1
-                except:
-                    pass
+        stats = self.stats
+        stats['total_positions_scanned'] += n - m + 1
+        stats['exact_matches'] += exact_count
+        stats['shift_or_triggers'] += trigger_count
+        stats['approximate_matches'] += approx_count
 
         return matches
 
@@ -265,6 +579,7 @@ class HybridDNAMatcher:
         print(f"\n📊 Search Statistics:")
         print(f"  Boyer-Moore scans: {self.stats['boyer_moore_scans']:,}")
         print(f"  Shift-Or triggers: {self.stats['shift_or_triggers']:,}")
+        print(f"  Searches answered by bytes.find: {self.stats['find_path_searches']:,}")
         print(f"  Exact matches found: {self.stats['exact_matches']}")
         print(f"  Approximate matches found: {self.stats['approximate_matches']}")
         print(f"  Total matches: {self.stats['exact_matches'] + self.stats['approximate_matches']}")
@@ -293,7 +608,7 @@ class HybridDNAMatcher:
 
 
 def search_dna_hybrid(text, pattern, pmd_threshold=0.75, k_errors=1, 
-                     overlapping=False, verbose=False):
+                     overlapping=False, verbose=False, workers=1):
     """
     Convenience function for hybrid DNA pattern matching.
 
@@ -304,17 +619,21 @@ def search_dna_hybrid(text, pattern, pmd_threshold=0.75, k_errors=1,
         k_errors: Maximum errors allowed in approximate matching
         overlapping: Find all overlapping matches (slower but complete)
         verbose: Print detailed output
+        workers: Processes for the Boyer-Moore scan (non-overlapping search)
 
     Returns:
         Tuple of (matches, statistics)
         matches: List of tuples (position, match_type, error_count)
         statistics: Dictionary of search statistics
     """
-    matcher = HybridDNAMatcher(pmd_threshold, k_errors)
+    matcher = HybridDNAMatcher(pmd_threshold, k_errors, workers)
 
-    if overlapping:
-        matches = matcher.search_all_overlapping(text, pattern, verbose)
-    else:
-        matches = matcher.search(text, pattern, verbose)
+    try:
+        if overlapping:
+            matches = matcher.search_all_overlapping(text, pattern, verbose)
+        else:
+            matches = matcher.search(text, pattern, verbose)
+    finally:
+        matcher.close()
 
     return matches, matcher.get_statistics()
@@ -15,7 +15,7 @@ Author: DNA Pattern Matching Project
 Date: November 2025
 """
 
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 import time
 
 class ShiftOrApproximate:
@@ -42,19 +42,7 @@ class ShiftOrApproximate:
         Raises:
             ValueError: If pattern length > 64 or k not in [1,2,3]
         """
-        if not pattern:
-            raise ValueError("Pattern cannot be empty")
-
-        if len(pattern) > 64:
-            raise ValueError(f"Pattern length {len(pattern)} exceeds 64 bp limit")
-
-        if k not in [1, 2, 3]:
-            raise ValueError(f"k must be 1, 2, or 3 (got {k})")
-
-        # Validate DNA sequence
-        valid_chars = set('ACGTN')
-        if not all(c in valid_chars for c in pattern.upper()):
-            raise ValueError("Pattern contains invalid DNA characters")
+        validate_pattern(pattern, k)
 
         self.pattern = pattern.upper()
         self.pattern_length = len(pattern)
@@ -230,6 +218,118 @@ class ShiftOrApproximate:
         return len(self.bitmasks) * 8 + len(self.pattern) + (self.k + 1) * 8 + 100
 
 
+def validate_pattern(pattern: str, k: int = 1) -> None:
+    """
+    Check a pattern and error budget against the Shift-Or limits.
+
+    Args:
+        pattern: The DNA pattern to search for (must be ≤ 64 bp)
+        k: Maximum number of errors allowed (1, 2, or 3)
+
+    Raises:
+        ValueError: If pattern is empty, longer than 64 bp or not DNA,
+                    or k not in [1,2,3]
+    """
+    if not pattern:
+        raise ValueError("Pattern cannot be empty")
+
+    if len(pattern) > 64:
+        raise ValueError(f"Pattern length {len(pattern)} exceeds 64 bp limit")
+
+    if k not in [1, 2, 3]:
+        raise ValueError(f"k must be 1, 2, or 3 (got {k})")
+
+    # Validate DNA sequence
+    valid_chars = set('ACGTN')
+    if not all(c in valid_chars for c in pattern.upper()):
+        raise ValueError("Pattern contains invalid DNA characters")
+
+
+def build_masks(pattern: str) -> List[int]:
+    """
+    Build the Shift-Or bitmask table for a pattern, indexed by byte value.
+
+    Same masks as ShiftOrApproximate._build_bitmasks, laid out so a text byte
+    indexes its mask directly: lower-case bytes share the upper-case mask and
+    bytes outside 'ACGTN' get the all-ones mask.
+
+    Args:
+        pattern: The DNA pattern to search for
+
+    Returns:
+        List of 256 bitmasks
+    """
+    pattern = pattern.upper()
+    all_ones = (1 << len(pattern)) - 1
+
+    by_char = {char: all_ones for char in 'ACGTN'}
+    for i, char in enumerate(pattern):
+        by_char[char] = by_char.get(char, all_ones) & ~(1 << i)
+
+    return [by_char.get(chr(byte).upper(), all_ones) for byte in range(256)]
+
+
+def run(masks: List[int], text: bytes, m: int, k: int,
+        start: int = 0, stop: Optional[int] = None) -> List[Tuple[int, int]]:
+    """
+    Run approximate Shift-Or over text[start:stop] with precomputed masks.
+
+    Same state updates and reporting as ShiftOrApproximate.search, without
+    rebuilding the masks or re-normalising the text on every call. The
+    window is read in place, so callers pass bounds instead of a slice.
+
+    Args:
+        masks: Bitmask table from build_masks
+        text: Byte-encoded DNA text to search in
+        m: Pattern length
+        k: Maximum number of errors allowed
+        start: First text index of the window (default: 0)
+        stop: End of the window, exclusive (default: len(text))
+
+    Returns:
+        List of tuples (position, error_level) where pattern matches,
+        with positions as indices into text
+    """
+    if stop is None:
+        stop = len(text)
+
+    D = [(1 << m) - 1] * (k + 1)
+    match_bit = 1 << (m - 1)
+    levels = range(1, k + 1)
+    matches = []
+
+    for j in range(start, stop):
+        B_char = masks[text[j]]
+        old_D = D.copy()
+
+        D[0] = ((old_D[0] << 1) | 1) & B_char
+        for d in levels:
+            D[d] = (((old_D[d - 1] << 1) | old_D[d] | old_D[d - 1]
+                     | (old_D[d] << 1)) | 1) & B_char
+
+        for d, state in enumerate(D):
+            if not state & match_bit:
+                matches.append((j - m + 1, d))
+                break
+
+    return matches
+
+
+def shift_or_approximate_search(text: str, pattern: str, k: int = 1) -> List[Tuple[int, int]]:
+    """
+    Search for approximate matches of a single pattern.
+
+    Args:
+        text: The DNA text to search in
+        pattern: The DNA pattern to search for (must be ≤ 64 bp)
+        k: Maximum number of errors allowed
+
+    Returns:
+        List of tuples (position, error_level) where pattern matches
+    """
+    return ShiftOrApproximate(pattern, k=k).search(text)
+
+
 def search_multiple_patterns(text: str, patterns: List[str], k: int = 1) -> Dict[str, List[Tuple[int, int]]]:
     """
     Search for multiple patterns with approximate matching.
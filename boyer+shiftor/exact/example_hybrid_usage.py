@@ -88,6 +88,8 @@ def example_3_threshold_comparison():
                         stats['total_positions_scanned'] * 100)
             print(f"Trigger rate: {trigger_rate:.2f}%")
             print(f"Skip rate: {skip_rate:.2f}%")
+        else:
+            print("No Boyer-Moore scan: matches found with bytes.find")
         print()
 
 
@@ -113,7 +115,10 @@ def example_4_pattern_lengths():
 
         print(f"Matches: {len(matches)}")
         print(f"Shift-Or triggers: {stats['shift_or_triggers']}")
-        print(f"Skip rate: {stats['total_skips']/stats['total_positions_scanned']*100:.1f}%")
+        if stats['total_positions_scanned'] > 0:
+            print(f"Skip rate: {stats['total_skips']/stats['total_positions_scanned']*100:.1f}%")
+        else:
+            print("Skip rate: n/a (matches found with bytes.find, no scan)")
 
 
 def example_5_fasta_integration():
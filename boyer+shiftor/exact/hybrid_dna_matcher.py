@@ -13,7 +13,7 @@ Date: November 2025
 """
 
 from boyer_moore import BoyerMoore
-from shift_or_exact import shift_or_exact_search
+from shift_or_exact import build_masks, run as run_shift_or, validate_pattern
 
 
 def calculate_partial_match_density(text, pattern, position):
@@ -36,18 +36,193 @@ def calculate_partial_match_density(text, pattern, position):
     if position + m > n:
         return 0.0, 0, m
 
-    # Compare from right to left (Boyer-Moore style)
-    matched = 0
-    for i in range(m - 1, -1, -1):
-        if text[position + i] == pattern[i]:
-            matched += 1
-        else:
-            break  # Stop at first mismatch
+    # Most windows already differ in the last character
+    if not m or text[position + m - 1] != pattern[m - 1]:
+        return 0.0, 0, m
+
+    # Compare from right to left (Boyer-Moore style), all lanes at once:
+    # each character is a 32-bit little-endian lane of one integer, so the
+    # highest set bit of window ^ pattern marks the rightmost mismatch.
+    window = text[position:position + m].encode("utf-32-le")
+    diff = (int.from_bytes(window, "little")
+            ^ int.from_bytes(pattern.encode("utf-32-le"), "little"))
+    matched = m - 1 - ((diff.bit_length() - 1) >> 5)
 
     pmd = matched / m if m > 0 else 0.0
     return pmd, matched, m
 
 
+# Symbols BoyerMoore's bad-character table knows (text is upper-cased)
+_BAD_CHAR_SYMBOLS = b"ACGTN"
+
+
+def _min_matched_for_threshold(m, pmd_threshold):
+    """Smallest matched-suffix length whose PMD reaches the threshold."""
+    return next((c for c in range(m + 1) if c / m >= pmd_threshold), m + 1)
+
+
+def _high_pmd_positions(text, pattern, pmd_threshold):
+    """
+    Yield every exact match or position whose PMD reaches the threshold.
+
+    PMD >= threshold exactly when the last c = _min_matched_for_threshold
+    characters of the window equal the last c characters of the pattern,
+    so the candidates are the occurrences of that pattern suffix, found
+    with bytes.find instead of a per-position comparison loop.
+
+    Args:
+        text: Byte-encoded DNA sequence
+        pattern: Byte-encoded pattern
+        pmd_threshold: PMD threshold for triggering Shift-Or
+
+    Yields:
+        Window start positions in increasing order
+    """
+    n = len(text)
+    m = len(pattern)
+    c = min(_min_matched_for_threshold(m, pmd_threshold), m)
+
+    if c == 0:
+        yield from range(n - m + 1)
+        return
+
+    suffix = pattern[m - c:]
+    find = text.find
+    hit = find(suffix, m - c)
+    while hit != -1:
+        yield hit - (m - c)
+        hit = find(suffix, hit + 1)
+
+
+def _exact_hits_without_triggers(text, pattern, pmd_threshold):
+    """
+    Return every exact match position if no position can trigger Shift-Or.
+
+    Uses _high_pmd_positions, so the whole check runs in C-level find calls
+    and stops at the first high-PMD position that is not an exact match.
+    Patterns with symbols outside the BoyerMoore bad-character table
+    ('ACGTN', any case) are left to the scan, whose shifts can step over
+    some of their occurrences.
+
+    Returns:
+        Sorted list of exact match positions, or None if a trigger is
+        possible or the pattern has symbols outside 'ACGTN'
+    """
+    if not set(pattern.upper()) <= set(_BAD_CHAR_SYMBOLS):
+        return None
+
+    hits = []
+    startswith = text.startswith
+    for i in _high_pmd_positions(text, pattern, pmd_threshold):
+        if not startswith(pattern, i):
+            return None
+        hits.append(i)
+    return hits
+
+
+def _encode_dna(seq):
+    """Return the ASCII bytes of a DNA sequence; bytes are passed through."""
+    if isinstance(seq, (bytes, bytearray)):
+        return bytes(seq)
+    return seq.encode("ascii")
+
+
+def _bad_character_table(bm):
+    """
+    Flatten a BoyerMoore bad-character table for byte-level lookups.
+
+    Entry ``j * 256 + byte`` holds the shift for a mismatch against ``byte``
+    at pattern index ``j``, following BoyerMoore._get_bad_char_shift: the
+    text character is upper-cased and anything outside the table counts as
+    'N'. Shifts are at least 1 so the scan always advances.
+
+    Args:
+        bm: BoyerMoore instance for the pattern
+
+    Returns:
+        Flat list of m * 256 shifts
+    """
+    table = bm.bad_char_table
+    rightmost_by_byte = [
+        table.get(chr(byte).upper(), table['N']) for byte in range(256)
+    ]
+
+    shifts = []
+    for j in range(bm.pattern_length):
+        shifts.extend(max(j - rightmost[j], 1) for rightmost in rightmost_by_byte)
+    return shifts
+
+
+def _bm_pmd_scan(text, pattern, bad_char, pmd_threshold, trace_skips=False):
+    """
+    Boyer-Moore scan with the PMD trigger over byte-encoded text.
+
+    This is the Cruiser loop of HybridDNAMatcher.search with its statistics
+    kept in locals. Positions that need Python-level handling (exact
+    matches and Shift-Or triggers) are returned as events instead of being
+    processed inline.
+
+    Args:
+        text: Byte-encoded DNA sequence
+        pattern: Byte-encoded pattern
+        bad_char: Flat shift table from _bad_character_table
+        pmd_threshold: PMD threshold for triggering Shift-Or
+        trace_skips: Also record bad-character skips longer than 1
+
+    Returns:
+        Tuple of (events, positions_scanned, characters_compared, skips)
+        events: List of (position, matched_chars, shift) in scan order;
+                matched_chars == m marks an exact match, shift == 1 a
+                PMD trigger and shift > 1 a recorded skip
+    """
+    n = len(text)
+    m = len(pattern)
+
+    min_matched = _min_matched_for_threshold(m, pmd_threshold)
+    from_bytes = int.from_bytes
+    pattern_word = from_bytes(pattern, "little")
+
+    events = []
+    scans = 0
+    compared = 0
+    skips = 0
+    i = 0
+
+    while i <= n - m:
+        scans += 1
+
+        # Most alignments fail on the last character. For the rest, window
+        # and pattern are compared as little-endian integers with one byte
+        # lane per base: the highest set bit of their XOR marks the
+        # rightmost mismatch, and no bit at all an exact match.
+        j = m - 1
+        if pattern[j] == text[i + j]:
+            diff = from_bytes(text[i:i + m], "little") ^ pattern_word
+            if not diff:
+                compared += m
+                events.append((i, m, 1))
+                i += 1
+                continue
+            j = (diff.bit_length() - 1) >> 3
+
+        compared += m - j
+
+        # PMD numerator: everything right of the mismatch matched
+        matched = m - 1 - j
+
+        if matched >= min_matched:
+            events.append((i, matched, 1))
+            i += 1
+        else:
+            shift = bad_char[j * 256 + text[i + j]]
+            skips += shift - 1
+            if trace_skips and shift > 1:
+                events.append((i, matched, shift))
+            i += shift
+
+    return events, scans, compared, skips
+
+
 class HybridDNAMatcher:
     """
     Heuristic-driven hybrid DNA pattern matcher (EXACT MATCHING ONLY).
@@ -79,32 +254,85 @@ class HybridDNAMatcher:
             'total_matches': 0,
             'total_positions_scanned': 0,
             'total_characters_compared': 0,
-            'total_skips': 0
+            'total_skips': 0,
+            'find_path_searches': 0
         }
 
-    def search(self, text, pattern, verbose=False):
+        # Per-pattern tables, reused while the same pattern is searched again
+        self._tables_pattern = None
+        self._tables = None
+
+    def _pattern_tables(self, pattern_b):
+        """
+        Return the (bad_char, so_masks, so_error) tables for a byte-encoded
+        pattern.
+
+        All are built once per pattern and kept until a different pattern
+        is searched, so repeated queries skip the BoyerMoore and Shift-Or
+        preprocessing. If Shift-Or rejects the pattern, so_masks is None
+        and so_error holds the reason; triggers then skip Shift-Or.
+        """
+        if pattern_b != self._tables_pattern:
+            pattern = pattern_b.decode("ascii")
+            bad_char = _bad_character_table(BoyerMoore(pattern))
+            try:
+                validate_pattern(pattern)
+            except ValueError as e:
+                so_masks, so_error = None, str(e)
+            else:
+                so_masks, so_error = build_masks(pattern), None
+            self._tables = (bad_char, so_masks, so_error)
+            self._tables_pattern = pattern_b
+        return self._tables
+
+    def search(self, text, pattern, verbose=False, collect_stats=True):
         """
         Search for pattern in text using hybrid approach.
 
         Args:
-            text: DNA sequence to search in
-            pattern: DNA pattern to search for
+            text: DNA sequence to search in (str or ASCII bytes)
+            pattern: DNA pattern to search for (str or ASCII bytes)
             verbose: Print detailed state transitions
+            collect_stats: Add this search to the statistics (default: True)
 
         Returns:
             List of positions where exact matches occur
+
+        When no position in the text can reach the PMD threshold without
+        being an exact match, Shift-Or can never trigger, so a non-verbose
+        search collects the matches with bytes.find instead of the
+        Boyer-Moore scan. Such searches are counted in 'find_path_searches'
+        and add to the match counters only; no scan ran, so scans,
+        positions, comparisons and skips are left unchanged.
         """
-        n = len(text)
-        m = len(pattern)
+        # Both sequences are scanned as ASCII bytes, whose items are ints
+        text_b = _encode_dna(text)
+        pattern_b = _encode_dna(pattern)
+        n = len(text_b)
+        m = len(pattern_b)
 
         if m > n or m == 0:
             return []
 
-        # Initialize Boyer-Moore for this pattern
-        bm = BoyerMoore(pattern)
+        # Verbose runs always scan so the skip trace is printed
+        if not verbose:
+            exact_hits = _exact_hits_without_triggers(
+                text_b, pattern_b, self.pmd_threshold
+            )
+            if exact_hits is not None:
+                if collect_stats:
+                    stats = self.stats
+                    stats['find_path_searches'] += 1
+                    stats['boyer_moore_matches'] += len(exact_hits)
+                    stats['total_matches'] += len(exact_hits)
+                return exact_hits
 
-        matches = []
-        i = 0  # Current position in text
+        # Boyer-Moore and Shift-Or tables are built once per pattern, not
+        # once per trigger
+        bad_char, so_masks, so_error = self._pattern_tables(pattern_b)
+
+        # Match positions; a set keeps the Shift-Or duplicate check O(1)
+        matches = set()
 
         if verbose:
             print(f"\n{'='*70}")
@@ -116,105 +344,153 @@ class HybridDNAMatcher:
             print(f"Algorithm: Boyer-Moore ↔ Shift-Or (both exact)")
             print(f"{'='*70}\n")
 
-        while i <= n - m:
-            self.stats['total_positions_scanned'] += 1
-            self.stats['boyer_moore_scans'] += 1
+        # STATE 1: Boyer-Moore (The Cruiser) runs as one byte-level scan;
+        # only exact hits and PMD triggers come back to Python
+        events, scans, compared, skips = _bm_pmd_scan(
+            text_b, pattern_b, bad_char,
+            self.pmd_threshold, trace_skips=verbose
+        )
+
+        # STATE 2: Shift-Or (The Investigator) handles the triggers. Quiet
+        # runs use a copy of the event loop with every print branch removed.
+        handle_events = (self._handle_events_verbose if verbose
+                         else self._handle_events_quiet)
+        bm_matches, so_triggers, so_matches = handle_events(
+            events, matches, text_b, m, so_masks, so_error
+        )
+
+        if collect_stats:
+            stats = self.stats
+            stats['boyer_moore_scans'] += scans
+            stats['total_positions_scanned'] += scans
+            stats['total_characters_compared'] += compared
+            stats['total_skips'] += skips
+            stats['boyer_moore_matches'] += bm_matches
+            stats['shift_or_triggers'] += so_triggers
+            stats['shift_or_matches'] += so_matches
+            stats['total_matches'] += bm_matches + so_matches
 
-            # STATE 1: Boyer-Moore (The Cruiser)
-            # Check for exact match at current position
-            exact_match = True
-            j = m - 1  # Start from end of pattern
+        if verbose:
+            print(f"\n{'='*70}")
+            print(f"Search Complete")
+            print(f"{'='*70}")
+            self.print_statistics()
 
-            while j >= 0:
-                self.stats['total_characters_compared'] += 1
-                if pattern[j] != text[i + j]:
-                    exact_match = False
-                    break
-                j -= 1
+        return sorted(matches)
 
-            if exact_match:
-                # Exact match found by Boyer-Moore
-                matches.append(i)
-                self.stats['boyer_moore_matches'] += 1
-                self.stats['total_matches'] += 1
+    def _handle_events_quiet(self, events, matches, text_b, m, so_masks,
+                             so_error):
+        """
+        Record exact hits and run Shift-Or on each trigger, without output.
 
-                if verbose:
-                    print(f"[POS {i:6d}] ✓ EXACT MATCH (Boyer-Moore)")
+        Args:
+            events: Events from _bm_pmd_scan (no skip events)
+            matches: Set of match positions, updated in place
+            text_b: Byte-encoded text
+            m: Pattern length
+            so_masks: Shift-Or masks, or None if Shift-Or rejects the pattern
+            so_error: Why Shift-Or rejects the pattern (unused here)
 
-                i += 1
+        Returns:
+            Tuple of (boyer_moore_matches, shift_or_triggers, shift_or_matches)
+        """
+        n = len(text_b)
+        add_match = matches.add
+        last_start = n - m
+
+        bm_matches = 0
+        so_triggers = 0
+        so_matches = 0
+
+        for i, matched_chars, _ in events:
+            if matched_chars == m:
+                add_match(i)
+                bm_matches += 1
                 continue
 
-            # No exact match - calculate PMD
-            pmd, matched_chars, total_chars = calculate_partial_match_density(
-                text, pattern, i
-            )
+            so_triggers += 1
+            if so_masks is None:
+                continue
 
-            # THE HEURISTIC TRIGGER
-            if pmd >= self.pmd_threshold:
-                # High PMD but not exact → might be close match
-                # STATE 2: Shift-Or (The Investigator)
-                self.stats['shift_or_triggers'] += 1
-
-                if verbose:
-                    print(f"[POS {i:6d}] 🔍 PMD={pmd:.2f} ({matched_chars}/{total_chars}) "
-                          f"→ TRIGGER Shift-Or")
-
-                # Extract window for Shift-Or exact matching
-                # We check a small window around current position
-                window_start = max(0, i - 1)
-                window_end = min(i + m + 1, n)
-                window = text[window_start:window_end]
-
-                # Run Shift-Or EXACT matching on window
-                try:
-                    shift_or_positions = shift_or_exact_search(window, pattern)
-
-                    if shift_or_positions:
-                        for local_pos in shift_or_positions:
-                            global_pos = window_start + local_pos
-                            if global_pos not in matches:  # Avoid duplicates
-                                matches.append(global_pos)
-                                self.stats['shift_or_matches'] += 1
-                                self.stats['total_matches'] += 1
-
-                                if verbose:
-                                    print(f"[POS {global_pos:6d}] ✓ EXACT MATCH (Shift-Or)")
-                except Exception as e:
-                    if verbose:
-                        print(f"[POS {i:6d}] ⚠ Shift-Or error: {e}")
-
-                i += 1  # Move forward by 1 after Shift-Or trigger
-            else:
-                # Low PMD → use Boyer-Moore shift for fast skipping
-                if j >= 0:
-                    bad_char = text[i + j]
-                    shift = bm.bad_character_shift(j, bad_char)
-                else:
-                    shift = 1
+            window_start = i - 1 if i else 0
+            window_end = n if i >= last_start else i + m + 1
+            for global_pos in run_shift_or(so_masks, text_b, m,
+                                           window_start, window_end):
+                if global_pos not in matches:
+                    add_match(global_pos)
+                    so_matches += 1
 
-                self.stats['total_skips'] += (shift - 1)
+        return bm_matches, so_triggers, so_matches
 
-                if verbose and shift > 1:
-                    print(f"[POS {i:6d}] ⏩ SKIP {shift} positions "
-                          f"(PMD={pmd:.2f} < {self.pmd_threshold})")
+    def _handle_events_verbose(self, events, matches, text_b, m, so_masks,
+                               so_error):
+        """
+        Verbose counterpart of _handle_events_quiet.
 
-                i += shift
+        Also prints every exact hit, recorded skip, trigger and Shift-Or
+        error as the scan reached it.
+        """
+        n = len(text_b)
+        pmd_threshold = self.pmd_threshold
 
-        if verbose:
-            print(f"\n{'='*70}")
-            print(f"Search Complete")
-            print(f"{'='*70}")
-            self.print_statistics()
+        bm_matches = 0
+        so_triggers = 0
+        so_matches = 0
+
+        for i, matched_chars, shift in events:
+            if matched_chars == m:
+                # Exact match found by Boyer-Moore
+                matches.add(i)
+                bm_matches += 1
+                print(f"[POS {i:6d}] ✓ EXACT MATCH (Boyer-Moore)")
+                continue
+
+            pmd = matched_chars / m
+
+            if shift > 1:
+                # Low PMD → Boyer-Moore skip
+                print(f"[POS {i:6d}] ⏩ SKIP {shift} positions "
+                      f"(PMD={pmd:.2f} < {pmd_threshold})")
+                continue
+
+            # THE HEURISTIC TRIGGER
+            # High PMD but not exact → might be close match
+            # STATE 2: Shift-Or (The Investigator)
+            so_triggers += 1
+            print(f"[POS {i:6d}] 🔍 PMD={pmd:.2f} ({matched_chars}/{m}) "
+                  f"→ TRIGGER Shift-Or")
+
+            # Window for Shift-Or exact matching
+            # We check a small window around current position
+            window_start = max(0, i - 1)
+            window_end = min(i + m + 1, n)
+
+            if so_masks is None:
+                print(f"[POS {i:6d}] ⚠ Shift-Or error: {so_error}")
+                continue
+
+            # Run Shift-Or EXACT matching on the window in place
+            try:
+                shift_or_positions = run_shift_or(
+                    so_masks, text_b, m, window_start, window_end
+                )
+
+                for global_pos in shift_or_positions:
+                    if global_pos not in matches:  # Avoid duplicates
+                        matches.add(global_pos)
+                        so_matches += 1
+                        print(f"[POS {global_pos:6d}] ✓ EXACT MATCH (Shift-Or)")
+            except Exception as e:
+                print(f"[POS {i:6d}] ⚠ Shift-Or error: {e}")
 
-        # Sort matches and remove duplicates
-        matches = sorted(set(matches))
-        return matches
+        return bm_matches, so_triggers, so_matches
 
     def print_statistics(self):
         """Print search statistics."""
         print(f"\n📊 Search Statistics:")
         print(f"  Boyer-Moore scans: {self.stats['boyer_moore_scans']:,}")
         print(f"  Shift-Or triggers: {self.stats['shift_or_triggers']:,}")
+        print(f"  Searches answered by bytes.find: {self.stats['find_path_searches']:,}")
         print(f"  ")
         print(f"  Matches found by Boyer-Moore: {self.stats['boyer_moore_matches']}")
         print(f"  Matches found by Shift-Or: {self.stats['shift_or_matches']}")
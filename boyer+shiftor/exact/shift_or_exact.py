@@ -15,7 +15,7 @@ Author: DNA Pattern Matching Project
 Date: November 2025
 """
 
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 import time
 
 class ShiftOrExact:
@@ -40,16 +40,7 @@ class ShiftOrExact:
         Raises:
             ValueError: If pattern length > 64 or contains invalid characters
         """
-        if not pattern:
-            raise ValueError("Pattern cannot be empty")
-
-        if len(pattern) > 64:
-            raise ValueError(f"Pattern length {len(pattern)} exceeds 64 bp limit for standard Shift-Or")
-
-        # Validate DNA sequence
-        valid_chars = set('ACGTN')
-        if not all(c in valid_chars for c in pattern.upper()):
-            raise ValueError("Pattern contains invalid DNA characters")
+        validate_pattern(pattern)
 
         self.pattern = pattern.upper()
         self.pattern_length = len(pattern)
@@ -200,6 +191,101 @@ class ShiftOrExact:
         return len(self.bitmasks) * 8 + len(self.pattern) + 100
 
 
+def validate_pattern(pattern: str) -> None:
+    """
+    Check a pattern against the Shift-Or limits.
+
+    Args:
+        pattern: The DNA pattern to search for (must be ≤ 64 bp)
+
+    Raises:
+        ValueError: If pattern is empty, longer than 64 bp or contains
+                    invalid characters
+    """
+    if not pattern:
+        raise ValueError("Pattern cannot be empty")
+
+    if len(pattern) > 64:
+        raise ValueError(f"Pattern length {len(pattern)} exceeds 64 bp limit for standard Shift-Or")
+
+    # Validate DNA sequence
+    valid_chars = set('ACGTN')
+    if not all(c in valid_chars for c in pattern.upper()):
+        raise ValueError("Pattern contains invalid DNA characters")
+
+
+def build_masks(pattern: str) -> List[int]:
+    """
+    Build the Shift-Or bitmask table for a pattern, indexed by byte value.
+
+    Same masks as ShiftOrExact._build_bitmasks, laid out so a text byte
+    indexes its mask directly: lower-case bytes share the upper-case mask and
+    bytes outside 'ACGTN' get the all-ones mask.
+
+    Args:
+        pattern: The DNA pattern to search for
+
+    Returns:
+        List of 256 bitmasks
+    """
+    pattern = pattern.upper()
+    all_ones = (1 << len(pattern)) - 1
+
+    by_char = {char: all_ones for char in 'ACGTN'}
+    for i, char in enumerate(pattern):
+        by_char[char] = by_char.get(char, all_ones) & ~(1 << i)
+
+    return [by_char.get(chr(byte).upper(), all_ones) for byte in range(256)]
+
+
+def run(masks: List[int], text: bytes, m: int,
+        start: int = 0, stop: Optional[int] = None) -> List[int]:
+    """
+    Run exact Shift-Or over text[start:stop] with precomputed masks.
+
+    Same state updates and reporting as ShiftOrExact.search, without
+    rebuilding the masks or re-normalising the text on every call. The
+    window is read in place, so callers pass bounds instead of a slice.
+
+    Args:
+        masks: Bitmask table from build_masks
+        text: Byte-encoded DNA text to search in
+        m: Pattern length
+        start: First text index of the window (default: 0)
+        stop: End of the window, exclusive (default: len(text))
+
+    Returns:
+        List of starting positions (indices into text) where pattern is found
+    """
+    if stop is None:
+        stop = len(text)
+
+    D = (1 << m) - 1
+    match_bit = 1 << (m - 1)
+    matches = []
+
+    for j in range(start, stop):
+        D = ((D << 1) | 1) & masks[text[j]]
+        if not D & match_bit:
+            matches.append(j - m + 1)
+
+    return matches
+
+
+def shift_or_exact_search(text: str, pattern: str) -> List[int]:
+    """
+    Search for exact matches of a single pattern.
+
+    Args:
+        text: The DNA text to search in
+        pattern: The DNA pattern to search for (must be ≤ 64 bp)
+
+    Returns:
+        List of starting positions where pattern is found
+    """
+    return ShiftOrExact(pattern).search(text)
+
+
 def search_multiple_patterns(text: str, patterns: List[str]) -> Dict[str, List[int]]:
     """
     Search for multiple patterns in the text.
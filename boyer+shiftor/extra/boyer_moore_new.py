@@ -8,30 +8,56 @@ Author: STARK_5 Analysis Group
 Date: November 2025
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+
+
 def build_bad_character_table(pattern):
     """
     Build the Bad Character Rule table for Boyer-Moore.
 
     Args:
-        pattern: The pattern string to search for
+        pattern: The pattern to search for (ASCII str or bytes)
 
     Returns:
-        Dictionary mapping each character to its rightmost occurrence position
+        List of 256 rightmost occurrence positions indexed by byte value,
+        -1 for bytes that do not occur in the pattern
     """
-    bad_char = {}
-    m = len(pattern)
+    if isinstance(pattern, str):
+        pattern = pattern.encode("ascii")
 
-    # For DNA, we only care about A, C, G, T
-    for char in 'ACGT':
-        bad_char[char] = -1
+    bad_char = [-1] * 256
 
-    # Record rightmost occurrence of each character in pattern
-    for i in range(m):
-        bad_char[pattern[i]] = i
+    # Record rightmost occurrence of each byte in pattern
+    for i, byte in enumerate(pattern):
+        bad_char[byte] = i
 
     return bad_char
 
 
+class _RightmostOccurrences(dict):
+    """Character -> rightmost occurrence position, -1 for absent characters."""
+
+    def __missing__(self, char):
+        return -1
+
+
+@lru_cache(maxsize=32)
+def _cached_bad_character_table(pattern):
+    """
+    Read-only bad character table, built once per pattern.
+
+    A bytes pattern gets a 256-entry tuple indexed by byte value; a str
+    pattern gets a character-keyed mapping. Both are indexed with a text
+    symbol and give -1 for symbols not in the pattern.
+    """
+    if isinstance(pattern, bytes):
+        return tuple(build_bad_character_table(pattern))
+    return MappingProxyType(
+        _RightmostOccurrences((char, i) for i, char in enumerate(pattern))
+    )
+
+
 def boyer_moore_search(text, pattern):
     """
     Perform Boyer-Moore exact pattern matching.
@@ -49,8 +75,14 @@ def boyer_moore_search(text, pattern):
     if m > n:
         return []
 
+    # Work on bytes where possible so the table is a flat tuple indexed by
+    # the ints that bytes indexing yields; other text stays str
+    if isinstance(text, str) and text.isascii() and pattern.isascii():
+        text = text.encode("ascii")
+        pattern = pattern.encode("ascii")
+
     # Preprocess
-    bad_char = build_bad_character_table(pattern)
+    bad_char = _cached_bad_character_table(pattern)
 
     matches = []
     i = 0  # Position in text
@@ -68,7 +100,7 @@ def boyer_moore_search(text, pattern):
             i += 1
         else:
             # Mismatch - use bad character rule
-            bad_char_shift = j - bad_char.get(text[i + j], -1)
+            bad_char_shift = j - bad_char[text[i + j]]
             i += max(1, bad_char_shift)
 
     return matches
@@ -79,8 +111,8 @@ def boyer_moore_with_partial_match_tracking(text, pattern, start_pos):
     Enhanced Boyer-Moore that tracks partial match quality.
 
     Args:
-        text: The text to search in
-        pattern: The pattern to search for
+        text: The text to search in (str, or bytes for byte-level lookups)
+        pattern: The pattern to search for, of the same type as text
         start_pos: Starting position in text
 
     Returns:
@@ -92,8 +124,8 @@ def boyer_moore_with_partial_match_tracking(text, pattern, start_pos):
     if start_pos + m > n:
         return False, 0, m, 1
 
-    # Build bad character table
-    bad_char = build_bad_character_table(pattern)
+    # Bad character table, shared by every call for this pattern
+    bad_char = _cached_bad_character_table(pattern)
 
     # Scan from right to left
     matched_chars = 0
@@ -112,7 +144,7 @@ def boyer_moore_with_partial_match_tracking(text, pattern, start_pos):
         return True, m, m, 1
 
     # Calculate shift using bad character rule
-    bad_char_shift = j - bad_char.get(text[start_pos + j], -1)
+    bad_char_shift = j - bad_char[text[start_pos + j]]
     shift = max(1, bad_char_shift)
 
     return False, matched_chars, m, shift